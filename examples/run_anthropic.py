@@ -16,13 +16,12 @@ def main() -> None:
     config = RunConfig(model_id="claude-3-5-sonnet")
     item_bank = build_item_bank(seed=17)
 
-    adapter = AnthropicAdapter(
+    with AnthropicAdapter(
         model="claude-3-5-sonnet-20241022",
         max_tokens=80,
-    )
-
-    engine = AdaptiveProfilerEngine(config=config, item_bank=item_bank, seed=42)
-    report = engine.run(adapter, run_id="anthropic-run")
+    ) as adapter:
+        engine = AdaptiveProfilerEngine(config=config, item_bank=item_bank, seed=42)
+        report = engine.run(adapter, run_id="anthropic-run")
 
     print(json.dumps(report.to_dict(), indent=2))
 
@@ -16,13 +16,12 @@ def main() -> None:
     config = RunConfig(model_id="gpt-4o")
     item_bank = build_item_bank(seed=17)
 
-    adapter = OpenAIAdapter(
+    with OpenAIAdapter(
         model="gpt-4o",
         max_tokens=80,
-    )
-
-    engine = AdaptiveProfilerEngine(config=config, item_bank=item_bank, seed=42)
-    report = engine.run(adapter, run_id="openai-run")
+    ) as adapter:
+        engine = AdaptiveProfilerEngine(config=config, item_bank=item_bank, seed=42)
+        report = engine.run(adapter, run_id="openai-run")
 
     print(json.dumps(report.to_dict(), indent=2))
 
@@ -3,17 +3,33 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from .base import BaseAPIAdapter
+from .base import AsyncBaseAPIAdapter, build_http_client
 
 if TYPE_CHECKING:
     from ..types import Item, ModelOutput, RegimeConfig
 
 ANTHROPIC_API_KEY_ENV = "ANTHROPIC_API_KEY"
 
+_anthropic_module = None
 
-class AnthropicAdapter(BaseAPIAdapter):
+
+def _load_anthropic():
+    """Import the anthropic SDK once per process."""
+    global _anthropic_module
+    if _anthropic_module is None:
+        try:
+            import anthropic
+        except ImportError as e:
+            raise ImportError(
+                "anthropic package required. Install with: pip install llmpsycho[anthropic]"
+            ) from e
+        _anthropic_module = anthropic
+    return _anthropic_module
+
+
+class AnthropicAdapter(AsyncBaseAPIAdapter):
     """Adapter for Anthropic Claude chat-completions API."""
 
     def __init__(
@@ -22,41 +38,174 @@ class AnthropicAdapter(BaseAPIAdapter):
         model: str = "claude-3-5-sonnet-20241022",
         api_key: str | None = None,
         max_tokens: int = 80,
+        max_concurrency: int = 8,
+        use_streaming: bool = False,
+        stop_predicate: Callable[[str], bool] | None = None,
+        cache_deterministic: bool = False,
+        cache_size: int = 256,
+        max_retries: int = 4,
+        retry_initial_seconds: float = 1.0,
+        retry_max_seconds: float = 30.0,
     ) -> None:
         api_key = api_key or os.environ.get(ANTHROPIC_API_KEY_ENV, "")
         if not api_key:
             raise ValueError(
                 f"API key required. Set {ANTHROPIC_API_KEY_ENV} or pass api_key=..."
             )
-        super().__init__(model=model, api_key=api_key, max_tokens=max_tokens)
+        super().__init__(
+            model=model,
+            api_key=api_key,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+            use_streaming=use_streaming,
+            stop_predicate=stop_predicate,
+            cache_deterministic=cache_deterministic,
+            cache_size=cache_size,
+            max_retries=max_retries,
+            retry_initial_seconds=retry_initial_seconds,
+            retry_max_seconds=retry_max_seconds,
+        )
         self._client = None
+        self._aclient = None
+        self._system_block_cache: dict[bytes, list[dict[str, Any]]] = {}
 
     @property
     def _anthropic(self):
         if self._client is None:
-            try:
-                import anthropic
-            except ImportError as e:
-                raise ImportError(
-                    "anthropic package required. Install with: pip install llmpsycho[anthropic]"
-                ) from e
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            self._client = _load_anthropic().Anthropic(
+                api_key=self.api_key,
+                http_client=build_http_client(),
+                max_retries=0,
+            )
         return self._client
 
-    def __call__(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
-        response = self._anthropic.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            system=regime.system_prompt or "",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=regime.temperature,
-        )
-        raw_text = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                raw_text += block.text
+    @property
+    def _async_anthropic(self):
+        if self._aclient is None:
+            self._aclient = _load_anthropic().AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=build_http_client(asynchronous=True),
+                max_retries=0,
+            )
+        return self._aclient
+
+    def _retryable_errors(self) -> tuple[type[BaseException], ...]:
+        try:
+            anthropic = _load_anthropic()
+        except ImportError:
+            return ()
+        # InternalServerError covers 5xx, including 529 overloaded responses.
+        return (anthropic.RateLimitError, anthropic.APIConnectionError, anthropic.InternalServerError)
+
+    def _request_kwargs(self, prompt: str, regime: RegimeConfig) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": regime.temperature,
+        }
+        system = self._system_blocks(regime)
+        if system:
+            kwargs["system"] = system
+        return kwargs
+
+    def _system_blocks(self, regime: RegimeConfig) -> list[dict[str, Any]]:
+        # The system prompt is shared by every item in a regime; mark it
+        # cacheable so repeat calls read the prefix from the prompt cache.
+        cached = self._system_block_cache.get(regime.prompt_key)
+        if cached is None:
+            cached = []
+            if regime.system_prompt:
+                cached.append(
+                    {
+                        "type": "text",
+                        "text": regime.system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                )
+            self._system_block_cache[regime.prompt_key] = cached
+        return cached
+
+    def _usage_output(self, raw_text: str, usage) -> ModelOutput:
+        # input_tokens excludes cache reads/writes; report the full prompt size
+        # so budgets match the uncached accounting used by other adapters.
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
         return self._make_output(
             raw_text=raw_text,
-            prompt_tokens=response.usage.input_tokens,
-            completion_tokens=response.usage.output_tokens,
+            prompt_tokens=usage.input_tokens + cache_read + cache_write,
+            completion_tokens=usage.output_tokens,
+            cached_prompt_tokens=int(cache_read),
         )
+
+    def _to_output(self, response) -> ModelOutput:
+        raw_text = "".join(getattr(block, "text", "") for block in response.content)
+        return self._usage_output(raw_text, response.usage)
+
+    def _streamed_output(self, kwargs: dict[str, Any], parts: list[str], snapshot) -> ModelOutput:
+        raw_text = "".join(parts)
+        usage = getattr(snapshot, "usage", None)
+        if usage is None:
+            system_text = "".join(block["text"] for block in kwargs.get("system", ()))
+            prompt_text = f"{system_text}\n{kwargs['messages'][0]['content']}"
+            return self._make_output(
+                raw_text=raw_text,
+                prompt_tokens=self._estimate_tokens(prompt_text),
+                completion_tokens=self._estimate_tokens(raw_text),
+            )
+        return self._usage_output(raw_text, usage)
+
+    def _stream_call(self, kwargs: dict[str, Any]) -> ModelOutput:
+        parts: list[str] = []
+        with self._anthropic.messages.stream(**kwargs) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                if self._should_stop_stream(parts):
+                    break
+            # Snapshot usage reflects tokens streamed so far, including on early stop.
+            snapshot = stream.current_message_snapshot
+        return self._streamed_output(kwargs, parts, snapshot)
+
+    async def _astream_call(self, kwargs: dict[str, Any]) -> ModelOutput:
+        parts: list[str] = []
+        async with self._async_anthropic.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                if self._should_stop_stream(parts):
+                    break
+            snapshot = stream.current_message_snapshot
+        return self._streamed_output(kwargs, parts, snapshot)
+
+    def _call(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        kwargs = self._request_kwargs(prompt, regime)
+        if self.use_streaming:
+            return self._stream_call(kwargs)
+        response = self._anthropic.messages.create(**kwargs)
+        return self._to_output(response)
+
+    async def _acall(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        kwargs = self._request_kwargs(prompt, regime)
+        if self.use_streaming:
+            return await self._astream_call(kwargs)
+        response = await self._async_anthropic.messages.create(**kwargs)
+        return self._to_output(response)
+
+    def submit_batch(self, triples: Iterable[tuple[str, RegimeConfig, Item]]) -> str:
+        requests = [
+            {"custom_id": custom_id, "params": params}
+            for custom_id, params in self._batch_entries(triples)
+        ]
+        batch = self._anthropic.messages.batches.create(requests=requests)
+        return batch.id
+
+    def fetch_batch(self, batch_id: str) -> dict[str, ModelOutput] | None:
+        batch = self._anthropic.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results: dict[str, ModelOutput] = {}
+        for entry in self._anthropic.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                continue
+            results[entry.custom_id] = self._to_output(entry.result.message)
+        return results
@@ -3,11 +3,66 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+import asyncio
+from collections import OrderedDict
+import hashlib
+import random
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 if TYPE_CHECKING:
     from ..types import Item, ModelOutput, RegimeConfig
 
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 600.0
+HTTP_TIMEOUT_SECONDS = 60.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+BATCH_POLL_INTERVAL_SECONDS = 30.0
+
+_httpx_module = None
+_http2_supported: bool | None = None
+
+
+def _load_httpx():
+    """Import httpx once per process; it ships with both provider SDKs."""
+    global _httpx_module
+    if _httpx_module is None:
+        import httpx
+
+        _httpx_module = httpx
+    return _httpx_module
+
+
+def _http2_available() -> bool:
+    global _http2_supported
+    if _http2_supported is None:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            _http2_supported = False
+        else:
+            _http2_supported = True
+    return _http2_supported
+
+
+def build_http_client(*, asynchronous: bool = False):
+    """
+    Build a pooled httpx client for injection into provider SDKs.
+
+    One client per adapter keeps TLS sessions warm across calls. HTTP/2 is used
+    when the optional ``h2`` package is installed.
+    """
+    httpx = _load_httpx()
+    cls = httpx.AsyncClient if asynchronous else httpx.Client
+    return cls(
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+    )
+
 
 class BaseAPIAdapter(ABC):
     """Base class for adapters that call real LLM APIs."""
@@ -18,10 +73,87 @@ class BaseAPIAdapter(ABC):
         model: str,
         api_key: str | None = None,
         max_tokens: int = 80,
+        max_concurrency: int = 8,
+        use_streaming: bool = False,
+        stop_predicate: Callable[[str], bool] | None = None,
+        cache_deterministic: bool = False,
+        cache_size: int = 256,
+        max_retries: int = 4,
+        retry_initial_seconds: float = 1.0,
+        retry_max_seconds: float = 30.0,
     ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if cache_size <= 0:
+            raise ValueError("cache_size must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
         self.model = model
         self.api_key = api_key or ""
         self.max_tokens = max_tokens
+        self.max_concurrency = max_concurrency
+        self.use_streaming = use_streaming
+        # Optional early-stop hook for streamed calls: return True once the
+        # accumulated text holds enough to score, and the stream is abandoned.
+        self.stop_predicate = stop_predicate
+        # Results for temperature-0 regimes are reusable when caching is enabled.
+        self.cache_deterministic = cache_deterministic
+        self.cache_size = cache_size
+        self._results: OrderedDict[str, ModelOutput] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[ModelOutput]] = {}
+        # Transient provider errors (rate limits, connection drops, 5xx) are
+        # retried here; SDK clients are built with their own retries disabled.
+        self.max_retries = max_retries
+        self.retry_initial_seconds = max(0.0, retry_initial_seconds)
+        self.retry_max_seconds = max(self.retry_initial_seconds, retry_max_seconds)
+
+    def _retryable_errors(self) -> tuple[type[BaseException], ...]:
+        return ()
+
+    def _retry_delay(self, attempt: int) -> float:
+        backoff = self.retry_initial_seconds * (2**attempt)
+        jitter = random.uniform(0.0, self.retry_initial_seconds)
+        return min(self.retry_max_seconds, backoff + jitter)
+
+    def _call_with_retry(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        retryable = self._retryable_errors()
+        attempt = 0
+        while True:
+            try:
+                return self._call(prompt, regime, item)
+            except retryable:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                attempt += 1
+
+    def _call_key(self, prompt: str, regime: RegimeConfig) -> str:
+        raw = f"{self.model}|{self.max_tokens}|{regime.temperature}|{regime.prompt_key.hex()}|{prompt}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cacheable(self, regime: RegimeConfig) -> bool:
+        return self.cache_deterministic and regime.temperature == 0
+
+    def _cache_get(self, key: str) -> ModelOutput | None:
+        out = self._results.get(key)
+        if out is not None:
+            self._results.move_to_end(key)
+        return out
+
+    def _cache_put(self, key: str, output: ModelOutput) -> None:
+        self._results[key] = output
+        self._results.move_to_end(key)
+        while len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+
+    def _should_stop_stream(self, parts: list[str]) -> bool:
+        return self.stop_predicate is not None and self.stop_predicate("".join(parts))
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # Rough 4-chars-per-token fallback used when a truncated stream never
+        # reports provider usage.
+        return max(1, len(text) // 4) if text else 0
 
     def _make_output(
         self,
@@ -29,6 +161,7 @@ class BaseAPIAdapter(ABC):
         raw_text: str,
         prompt_tokens: int,
         completion_tokens: int,
+        cached_prompt_tokens: int = 0,
     ) -> "ModelOutput":
         from ..types import ModelOutput
 
@@ -37,9 +170,206 @@ class BaseAPIAdapter(ABC):
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
             score_override=None,
+            cached_prompt_tokens=cached_prompt_tokens,
         )
 
-    @abstractmethod
     def __call__(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
         """Call the model and return ModelOutput."""
+        if not self._cacheable(regime):
+            return self._call_with_retry(prompt, regime, item)
+        key = self._call_key(prompt, regime)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        output = self._call_with_retry(prompt, regime, item)
+        self._cache_put(key, output)
+        return output
+
+    @abstractmethod
+    def _call(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        """Provider-specific blocking call."""
+        ...
+
+    def close(self) -> None:
+        """Release the blocking SDK client and its HTTP connection pool."""
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+            self._client = None
+
+    def __enter__(self) -> "BaseAPIAdapter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def batch_custom_id(regime: RegimeConfig, item: Item) -> str:
+        """Identifier used to match batch results back to (regime, item)."""
+        return f"{regime.regime_id}-{item.item_id}"
+
+    def _batch_entries(
+        self,
+        triples: Iterable[tuple[str, RegimeConfig, Item]],
+    ) -> list[tuple[str, dict[str, Any]]]:
+        entries: list[tuple[str, dict[str, Any]]] = []
+        seen: set[str] = set()
+        for prompt, regime, item in triples:
+            custom_id = self.batch_custom_id(regime, item)
+            if custom_id in seen:
+                raise ValueError(f"Duplicate batch entry for '{custom_id}'")
+            seen.add(custom_id)
+            entries.append((custom_id, self._request_kwargs(prompt, regime)))
+        if not entries:
+            raise ValueError("Batch must contain at least one request")
+        return entries
+
+    def _request_kwargs(self, prompt: str, regime: RegimeConfig) -> dict[str, Any]:
+        raise NotImplementedError(f"{type(self).__name__} does not build provider requests")
+
+    def submit_batch(self, triples: Iterable[tuple[str, RegimeConfig, Item]]) -> str:
+        """
+        Submit calls through the provider's discounted batch API and return the batch id.
+
+        Batch results arrive asynchronously, so this suits offline evaluation rather
+        than the adaptive engine loop, where each selection depends on the last score.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch submission")
+
+    def fetch_batch(self, batch_id: str) -> dict[str, ModelOutput] | None:
+        """
+        Return outputs keyed by batch_custom_id, or None while the batch is still running.
+
+        Requests that failed provider-side are omitted from the mapping.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch retrieval")
+
+    def wait_batch(
+        self,
+        batch_id: str,
+        *,
+        interval_seconds: float = BATCH_POLL_INTERVAL_SECONDS,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, ModelOutput]:
+        """Block until fetch_batch reports completion, sleeping between polls."""
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        while True:
+            results = self.fetch_batch(batch_id)
+            if results is not None:
+                return results
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch '{batch_id}' did not finish within {timeout_seconds}s")
+            time.sleep(interval_seconds)
+
+
+class AsyncBaseAPIAdapter(BaseAPIAdapter):
+    """Base class for adapters that also expose an awaitable call path."""
+
+    _semaphore: asyncio.Semaphore | None = None
+    _semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    def _limiter(self) -> asyncio.Semaphore:
+        # Semaphores must be created inside the loop that awaits them; rebuild
+        # when the adapter is reused from a different asyncio.run().
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def acall(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        """
+        Call the model without blocking the event loop.
+
+        At most max_concurrency requests are in flight. Concurrent calls with an
+        identical (model, regime, prompt) key share one request.
+        """
+        key = self._call_key(prompt, regime)
+        cacheable = self._cacheable(regime)
+        if cacheable:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            # Shield so a cancelled waiter does not cancel the shared request.
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[ModelOutput] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            output = await self._acall_with_retry(prompt, regime, item)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so the loop does not warn when no duplicate was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(output)
+            if cacheable:
+                self._cache_put(key, output)
+            return output
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _acall_with_retry(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        retryable = self._retryable_errors()
+        attempt = 0
+        while True:
+            try:
+                # Release the concurrency slot while backing off.
+                async with self._limiter():
+                    return await self._acall(prompt, regime, item)
+            except retryable:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                attempt += 1
+
+    async def acall_many(
+        self,
+        triples: Iterable[tuple[str, RegimeConfig, Item]],
+    ) -> list[ModelOutput]:
+        """Dispatch independent calls concurrently; results keep input order."""
+        return list(await asyncio.gather(*(self.acall(p, r, i) for p, r, i in triples)))
+
+    async def aclose(self) -> None:
+        """Release both the async and blocking SDK clients."""
+        aclient = getattr(self, "_aclient", None)
+        if aclient is not None:
+            await aclient.close()
+            self._aclient = None
+        self.close()
+
+    async def __aenter__(self) -> "AsyncBaseAPIAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def poll_batch(
+        self,
+        batch_id: str,
+        *,
+        interval_seconds: float = BATCH_POLL_INTERVAL_SECONDS,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, ModelOutput]:
+        """Awaitable wait_batch; polls off-loop and yields to the event loop between polls."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout_seconds is None else loop.time() + timeout_seconds
+        while True:
+            results = await asyncio.to_thread(self.fetch_batch, batch_id)
+            if results is not None:
+                return results
+            if deadline is not None and loop.time() >= deadline:
+                raise TimeoutError(f"Batch '{batch_id}' did not finish within {timeout_seconds}s")
+            await asyncio.sleep(interval_seconds)
+
+    @abstractmethod
+    async def _acall(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        """Provider-specific awaitable call."""
         ...
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+import json
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from .base import BaseAPIAdapter
+from .base import AsyncBaseAPIAdapter, build_http_client
 
 if TYPE_CHECKING:
     from ..types import Item, ModelOutput, RegimeConfig
 
 OPENAI_API_KEY_ENV = "OPENAI_API_KEY"
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+OPENAI_BATCH_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing"})
 
+_openai_module = None
 
-class OpenAIAdapter(BaseAPIAdapter):
+
+def _load_openai():
+    """Import the openai SDK once per process."""
+    global _openai_module
+    if _openai_module is None:
+        try:
+            import openai
+        except ImportError as e:
+            raise ImportError(
+                "openai package required. Install with: pip install llmpsycho[openai]"
+            ) from e
+        _openai_module = openai
+    return _openai_module
+
+
+class OpenAIAdapter(AsyncBaseAPIAdapter):
     """Adapter for OpenAI chat-completions API."""
 
     def __init__(
@@ -22,44 +41,219 @@ class OpenAIAdapter(BaseAPIAdapter):
         model: str = "gpt-4o",
         api_key: str | None = None,
         max_tokens: int = 80,
+        max_concurrency: int = 8,
+        use_streaming: bool = False,
+        stop_predicate: Callable[[str], bool] | None = None,
+        cache_deterministic: bool = False,
+        cache_size: int = 256,
+        max_retries: int = 4,
+        retry_initial_seconds: float = 1.0,
+        retry_max_seconds: float = 30.0,
     ) -> None:
         api_key = api_key or os.environ.get(OPENAI_API_KEY_ENV, "")
         if not api_key:
             raise ValueError(
                 f"API key required. Set {OPENAI_API_KEY_ENV} or pass api_key=..."
             )
-        super().__init__(model=model, api_key=api_key, max_tokens=max_tokens)
+        super().__init__(
+            model=model,
+            api_key=api_key,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+            use_streaming=use_streaming,
+            stop_predicate=stop_predicate,
+            cache_deterministic=cache_deterministic,
+            cache_size=cache_size,
+            max_retries=max_retries,
+            retry_initial_seconds=retry_initial_seconds,
+            retry_max_seconds=retry_max_seconds,
+        )
         self._client = None
+        self._aclient = None
+        self._system_message_cache: dict[bytes, tuple[dict[str, str], ...]] = {}
 
     @property
     def _openai(self):
         if self._client is None:
-            try:
-                from openai import OpenAI
-            except ImportError as e:
-                raise ImportError(
-                    "openai package required. Install with: pip install llmpsycho[openai]"
-                ) from e
-            self._client = OpenAI(api_key=self.api_key)
+            self._client = _load_openai().OpenAI(
+                api_key=self.api_key,
+                http_client=build_http_client(),
+                max_retries=0,
+            )
         return self._client
 
-    def __call__(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
-        messages = []
-        if regime.system_prompt:
-            messages.append({"role": "system", "content": regime.system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
-        response = self._openai.chat.completions.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            messages=messages,
-            temperature=regime.temperature,
-        )
+    @property
+    def _async_openai(self):
+        if self._aclient is None:
+            self._aclient = _load_openai().AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=build_http_client(asynchronous=True),
+                max_retries=0,
+            )
+        return self._aclient
+
+    def _retryable_errors(self) -> tuple[type[BaseException], ...]:
+        try:
+            openai = _load_openai()
+        except ImportError:
+            return ()
+        return (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+    def _request_kwargs(self, prompt: str, regime: RegimeConfig) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "messages": [*self._system_messages(regime), {"role": "user", "content": prompt}],
+            "temperature": regime.temperature,
+        }
+
+    def _system_messages(self, regime: RegimeConfig) -> tuple[dict[str, str], ...]:
+        # System message first and byte-identical per regime so the provider's
+        # automatic prefix cache can match across calls. Keyed by the prompt
+        # digest since regime ids may be reused with different prompts.
+        cached = self._system_message_cache.get(regime.prompt_key)
+        if cached is None:
+            system_prompt = regime.system_prompt.strip()
+            cached = ({"role": "system", "content": system_prompt},) if system_prompt else ()
+            self._system_message_cache[regime.prompt_key] = cached
+        return cached
+
+    def _to_output(self, response) -> ModelOutput:
         choice = response.choices[0]
-        raw_text = choice.message.content or ""
-        usage = response.usage
+        return self._usage_output(choice.message.content or "", response.usage)
+
+    def _usage_output(self, raw_text: str, usage) -> ModelOutput:
+        # Prefix-cache hits are reported under prompt_tokens_details on models that support them.
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
         return self._make_output(
             raw_text=raw_text,
             prompt_tokens=usage.prompt_tokens,
             completion_tokens=usage.completion_tokens,
+            cached_prompt_tokens=int(cached),
         )
+
+    def _prompt_text(self, kwargs: dict[str, Any]) -> str:
+        return "\n".join(str(m["content"]) for m in kwargs["messages"])
+
+    def _streamed_output(self, kwargs: dict[str, Any], parts: list[str], usage) -> ModelOutput:
+        raw_text = "".join(parts)
+        if usage is None:
+            return self._make_output(
+                raw_text=raw_text,
+                prompt_tokens=self._estimate_tokens(self._prompt_text(kwargs)),
+                completion_tokens=self._estimate_tokens(raw_text),
+            )
+        return self._usage_output(raw_text, usage)
+
+    def _stream_call(self, kwargs: dict[str, Any]) -> ModelOutput:
+        parts: list[str] = []
+        usage = None
+        stream = self._openai.chat.completions.create(
+            **kwargs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if self._should_stop_stream(parts):
+                        break
+        finally:
+            stream.close()
+        return self._streamed_output(kwargs, parts, usage)
+
+    async def _astream_call(self, kwargs: dict[str, Any]) -> ModelOutput:
+        parts: list[str] = []
+        usage = None
+        stream = await self._async_openai.chat.completions.create(
+            **kwargs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if self._should_stop_stream(parts):
+                        break
+        finally:
+            await stream.close()
+        return self._streamed_output(kwargs, parts, usage)
+
+    def _call(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        kwargs = self._request_kwargs(prompt, regime)
+        if self.use_streaming:
+            return self._stream_call(kwargs)
+        response = self._openai.chat.completions.create(**kwargs)
+        return self._to_output(response)
+
+    async def _acall(self, prompt: str, regime: RegimeConfig, item: Item) -> ModelOutput:
+        kwargs = self._request_kwargs(prompt, regime)
+        if self.use_streaming:
+            return await self._astream_call(kwargs)
+        response = await self._async_openai.chat.completions.create(**kwargs)
+        return self._to_output(response)
+
+    def submit_batch(self, triples: Iterable[tuple[str, RegimeConfig, Item]]) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": OPENAI_BATCH_ENDPOINT,
+                    "body": body,
+                }
+            )
+            for custom_id, body in self._batch_entries(triples)
+        ]
+        upload = self._openai.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self._openai.batches.create(
+            input_file_id=upload.id,
+            endpoint=OPENAI_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def fetch_batch(self, batch_id: str) -> dict[str, ModelOutput] | None:
+        batch = self._openai.batches.retrieve(batch_id)
+        if batch.status in OPENAI_BATCH_PENDING_STATUSES:
+            return None
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch '{batch_id}' ended with status '{batch.status}'")
+        if not batch.output_file_id:
+            return {}
+
+        results: dict[str, ModelOutput] = {}
+        content = self._openai.files.content(batch.output_file_id).text
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            body = response.get("body") or {}
+            usage = body.get("usage") or {}
+            details = usage.get("prompt_tokens_details") or {}
+            results[row["custom_id"]] = self._make_output(
+                raw_text=body["choices"][0]["message"].get("content") or "",
+                prompt_tokens=int(usage.get("prompt_tokens", 0)),
+                completion_tokens=int(usage.get("completion_tokens", 0)),
+                cached_prompt_tokens=int(details.get("cached_tokens") or 0),
+            )
+        return results
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable
 
 from .traits import CRITICAL_TRAITS_DEFAULT
 from .types import RegimeConfig
@@ -22,7 +23,7 @@ def _default_regimes() -> tuple[RegimeConfig, ...]:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Configurable controls for adaptive profiling."""
 
@@ -58,6 +59,9 @@ class RunConfig:
     initial_forced_items: int = 8
     exploration_start: float = 0.25
     exploration_end: float = 0.10
+    # "top_k": exploration steps pick uniformly among the 3-8 best candidates.
+    # "two_choice": they score two random candidates and keep the better one.
+    exploration_policy: str = "top_k"
     expected_gain_floor: float = 0.010
     low_gain_patience: int = 3
 
@@ -68,21 +72,62 @@ class RunConfig:
     prior_variance: float = 1.0
 
     def __post_init__(self) -> None:
-        if self.call_cap <= 0:
-            raise ValueError("call_cap must be positive")
-        if self.token_cap <= 0:
-            raise ValueError("token_cap must be positive")
-        if self.min_calls_before_global_stop > self.call_cap:
-            raise ValueError("min_calls_before_global_stop must be <= call_cap")
-        if not self.critical_traits:
-            raise ValueError("critical_traits must be non-empty")
-        if self.stage_a_min > self.stage_a_max:
-            raise ValueError("stage_a_min must be <= stage_a_max")
-        if self.stage_b_min > self.stage_b_max:
-            raise ValueError("stage_b_min must be <= stage_b_max")
-        if self.stage_c_min > self.stage_c_max:
-            raise ValueError("stage_c_min must be <= stage_c_max")
-        if self.stage_a_min + self.stage_b_min + self.stage_c_min > self.call_cap:
-            raise ValueError("minimum stage totals exceed call_cap")
-        if not (0.0 < self.exploration_end <= self.exploration_start <= 1.0):
-            raise ValueError("exploration bounds must satisfy 0 < end <= start <= 1")
+        self._validate(_CONSTRAINTS)
+
+    def _validate(self, constraints: tuple[_Constraint, ...]) -> None:
+        for _, check, message in constraints:
+            if not check(self):
+                raise ValueError(message)
+
+    def replace(self, **overrides: Any) -> RunConfig:
+        """Return a copy with ``overrides`` applied, re-checking only the constraints they touch."""
+        unknown = set(overrides) - _FIELD_NAMES
+        if unknown:
+            raise TypeError(f"unknown RunConfig fields: {', '.join(sorted(unknown))}")
+        clone = object.__new__(RunConfig)
+        for name in _FIELD_NAMES:
+            object.__setattr__(clone, name, overrides.get(name, getattr(self, name)))
+        affected = {index for name in overrides for index in _CONSTRAINTS_BY_FIELD.get(name, ())}
+        clone._validate(tuple(_CONSTRAINTS[index] for index in sorted(affected)))
+        return clone
+
+
+# (fields read, predicate, error message); order matches the error precedence
+# of a full validation.
+_Constraint = tuple[tuple[str, ...], Callable[[RunConfig], bool], str]
+
+_CONSTRAINTS: tuple[_Constraint, ...] = (
+    (("call_cap",), lambda c: c.call_cap > 0, "call_cap must be positive"),
+    (("token_cap",), lambda c: c.token_cap > 0, "token_cap must be positive"),
+    (
+        ("min_calls_before_global_stop", "call_cap"),
+        lambda c: c.min_calls_before_global_stop <= c.call_cap,
+        "min_calls_before_global_stop must be <= call_cap",
+    ),
+    (("critical_traits",), lambda c: bool(c.critical_traits), "critical_traits must be non-empty"),
+    (("stage_a_min", "stage_a_max"), lambda c: c.stage_a_min <= c.stage_a_max, "stage_a_min must be <= stage_a_max"),
+    (("stage_b_min", "stage_b_max"), lambda c: c.stage_b_min <= c.stage_b_max, "stage_b_min must be <= stage_b_max"),
+    (("stage_c_min", "stage_c_max"), lambda c: c.stage_c_min <= c.stage_c_max, "stage_c_min must be <= stage_c_max"),
+    (
+        ("stage_a_min", "stage_b_min", "stage_c_min", "call_cap"),
+        lambda c: c.stage_a_min + c.stage_b_min + c.stage_c_min <= c.call_cap,
+        "minimum stage totals exceed call_cap",
+    ),
+    (
+        ("exploration_start", "exploration_end"),
+        lambda c: 0.0 < c.exploration_end <= c.exploration_start <= 1.0,
+        "exploration bounds must satisfy 0 < end <= start <= 1",
+    ),
+    (
+        ("exploration_policy",),
+        lambda c: c.exploration_policy in ("top_k", "two_choice"),
+        "exploration_policy must be 'top_k' or 'two_choice'",
+    ),
+)
+
+_FIELD_NAMES = frozenset(f.name for f in fields(RunConfig))
+
+_CONSTRAINTS_BY_FIELD: dict[str, tuple[int, ...]] = {
+    name: tuple(index for index, (names, _, _) in enumerate(_CONSTRAINTS) if name in names)
+    for name in _FIELD_NAMES
+}
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 import statistics
 
-from .types import ResponseRecord
+from .types import ResponseRecord, ResponseRecordBatch
+
+Records = list[ResponseRecord] | ResponseRecordBatch
 
 
 def _mean(values: list[float]) -> float:
@@ -14,28 +15,37 @@ def _mean(values: list[float]) -> float:
     return sum(values) / len(values)
 
 
+def _columns(records: Records) -> ResponseRecordBatch:
+    if isinstance(records, ResponseRecordBatch):
+        return records
+    return ResponseRecordBatch.from_records(records)
+
+
 def _z(x: float, scale: float = 0.20) -> float:
     scale = max(scale, 1e-6)
     return x / scale
 
 
-def paraphrase_consistency(records: list[ResponseRecord], group_by_item: dict[str, str | None]) -> float:
-    grouped: dict[str, list[float]] = defaultdict(list)
-    for record in records:
-        group = group_by_item.get(record.item_id)
+def paraphrase_consistency(records: Records, group_by_item: dict[str, str | None]) -> float:
+    columns = _columns(records)
+    # Track only (min, max, count) per group; the spread is all that is needed.
+    spreads: dict[str, list[float]] = {}
+    group_of = group_by_item.get
+    for item_id, score in zip(columns.item_ids, columns.scores):
+        group = group_of(item_id)
         if not group:
             continue
-        grouped[group].append(record.score)
-
-    if not grouped:
-        return 1.0
-
-    diffs: list[float] = []
-    for vals in grouped.values():
-        if len(vals) < 2:
+        bounds = spreads.get(group)
+        if bounds is None:
+            spreads[group] = [score, score, 1]
             continue
-        diffs.append(max(vals) - min(vals))
+        if score < bounds[0]:
+            bounds[0] = score
+        elif score > bounds[1]:
+            bounds[1] = score
+        bounds[2] += 1
 
+    diffs = [hi - lo for lo, hi, count in spreads.values() if count >= 2]
     if not diffs:
         return 1.0
     avg_diff = _mean(diffs)
@@ -43,26 +53,28 @@ def paraphrase_consistency(records: list[ResponseRecord], group_by_item: dict[st
 
 
 def benchmark_training_index(
-    records: list[ResponseRecord],
+    records: Records,
     item_is_ood: dict[str, bool],
     item_is_sentinel: dict[str, bool],
 ) -> tuple[float, dict[str, float]]:
     """
     BTI combines in-bank vs paraphrase/OOD performance gaps and person-fit anomaly.
     """
+    columns = _columns(records)
     in_bank_scores: list[float] = []
     ood_scores: list[float] = []
-    residuals: list[float] = []
+    residuals = [abs(score - p) for score, p in zip(columns.scores, columns.expected_probabilities)]
+    is_ood = item_is_ood.get
+    is_sentinel = item_is_sentinel.get
 
-    for record in records:
-        residuals.append(abs(record.score - record.expected_probability))
-        if item_is_ood.get(record.item_id, False):
-            ood_scores.append(record.score)
+    for item_id, score in zip(columns.item_ids, columns.scores):
+        if is_ood(item_id, False):
+            ood_scores.append(score)
             continue
-        if item_is_sentinel.get(record.item_id, False):
+        if is_sentinel(item_id, False):
             # Keep sentinels out of in-bank mean to avoid bias.
             continue
-        in_bank_scores.append(record.score)
+        in_bank_scores.append(score)
 
     in_bank = _mean(in_bank_scores)
     ood = _mean(ood_scores)
@@ -77,20 +89,26 @@ def benchmark_training_index(
     return bti, components
 
 
-def estimate_ood_gap(records: list[ResponseRecord], item_is_ood: dict[str, bool]) -> float:
-    in_bank = [r.score for r in records if not item_is_ood.get(r.item_id, False)]
-    ood = [r.score for r in records if item_is_ood.get(r.item_id, False)]
+def estimate_ood_gap(records: Records, item_is_ood: dict[str, bool]) -> float:
+    columns = _columns(records)
+    in_bank: list[float] = []
+    ood: list[float] = []
+    is_ood = item_is_ood.get
+    for item_id, score in zip(columns.item_ids, columns.scores):
+        (ood if is_ood(item_id, False) else in_bank).append(score)
     return _mean(in_bank) - _mean(ood)
 
 
-def summary_call_stats(records: list[ResponseRecord]) -> dict[str, float]:
+def summary_call_stats(records: Records) -> dict[str, float]:
     calls = len(records)
     if calls == 0:
         return {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency_ms_p50": 0.0}
 
-    prompt = sum(r.prompt_tokens for r in records)
-    completion = sum(r.completion_tokens for r in records)
-    latencies = sorted(r.latency_ms for r in records)
+    columns = _columns(records)
+    prompt = sum(columns.prompt_tokens)
+    completion = sum(columns.completion_tokens)
+    # statistics.median sorts its own copy; pre-sorting would sort twice.
+    latencies = columns.latency_ms
     return {
         "calls": calls,
         "prompt_tokens": float(prompt),
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+from array import array
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import math
 import time
+from typing import Callable, Sequence
 import uuid
 
 from .config import RunConfig
 from .diagnostics import benchmark_training_index, estimate_ood_gap, paraphrase_consistency
-from .item_bank import build_item_bank
+from .item_bank import REFUSAL_FAMILIES, build_item_bank
 from .mirt import DiagonalMIRT
 from .scoring import score_item
 from .selector import AdaptiveSelector
@@ -23,18 +26,66 @@ from .types import (
     RegimeConfig,
     RegimeReport,
     ResponseRecord,
+    ResponseRecordBatch,
     TraitEstimate,
 )
 
 
+def _posterior_snapshot(state: PosteriorState) -> dict[str, dict[str, float]]:
+    return {
+        "mean": {trait: round(value, 6) for trait, value in state.mean.items()},
+        "variance": {trait: round(value, 6) for trait, value in state.variance.items()},
+    }
+
+
+def _preview(text: str, *, limit: int = 180) -> str:
+    # Whitespace-collapse a bounded head first: its compacted form is a prefix of
+    # the fully compacted text, so it suffices whenever it already overflows.
+    head = text[: limit * 4]
+    compact = " ".join(head.split())
+    if len(head) < len(text) and len(compact) <= limit:
+        compact = " ".join(text.split())
+    if len(compact) <= limit:
+        return compact
+    return compact[: max(0, limit - 3)] + "..."
+
+
+def _run_batch_job(
+    config: RunConfig,
+    item_bank: list[Item],
+    seed: int,
+    mirt: DiagonalMIRT,
+    adapter_factory: Callable[[], object],
+    run_id: str | None,
+) -> ProfileReport:
+    engine = AdaptiveProfilerEngine(config=config, item_bank=item_bank, seed=seed, mirt=mirt)
+    adapter = adapter_factory()
+    try:
+        return engine.run(adapter, run_id=run_id)
+    finally:
+        close = getattr(adapter, "close", None)
+        if close is not None:
+            close()
+
+
 class AdaptiveProfilerEngine:
     """Run adaptive psychometric profiling under convergence-first defaults."""
 
-    def __init__(self, config: RunConfig | None = None, item_bank: list[Item] | None = None, seed: int = 7):
+    def __init__(
+        self,
+        config: RunConfig | None = None,
+        item_bank: list[Item] | None = None,
+        seed: int = 7,
+        mirt: DiagonalMIRT | None = None,
+    ):
         self.config = config or RunConfig()
+        self.seed = seed
         self.item_bank = item_bank or build_item_bank(seed=17)
         self.items_by_id = {item.item_id: item for item in self.item_bank}
-        self.mirt = DiagonalMIRT()
+        self._item_is_ood = {item.item_id: item.is_ood for item in self.item_bank}
+        self._item_is_sentinel = {item.item_id: item.is_sentinel for item in self.item_bank}
+        self._group_by_item = {item.item_id: item.paraphrase_group for item in self.item_bank}
+        self.mirt = mirt or DiagonalMIRT()
         self.selector = AdaptiveSelector(self.config, self.mirt, seed=seed)
         self.regimes: dict[str, RegimeConfig] = {regime.regime_id: regime for regime in self.config.regimes}
         if "core" not in self.regimes:
@@ -71,18 +122,15 @@ class AdaptiveProfilerEngine:
         if not active:
             return False, False, False
 
-        reliability_ok = True
-        ci_ok = True
-        coverage_ok = True
-
-        for trait in self.config.critical_traits:
-            if trait_counts[trait] < self.config.min_items_per_critical_trait:
-                coverage_ok = False
-            for posterior in active:
-                if posterior.reliability(trait) < self.config.reliability_target:
-                    reliability_ok = False
-                if posterior.ci95_width(trait) > self.config.ci_width_target:
-                    ci_ok = False
+        config = self.config
+        critical = config.critical_traits
+        coverage_ok = all(trait_counts[trait] >= config.min_items_per_critical_trait for trait in critical)
+        reliability_ok = all(
+            rel >= config.reliability_target for posterior in active for rel in posterior.reliability_vec(critical)
+        )
+        ci_ok = all(
+            width <= config.ci_width_target for posterior in active for width in posterior.ci95_width_vec(critical)
+        )
 
         return reliability_ok, ci_ok, coverage_ok
 
@@ -100,12 +148,8 @@ class AdaptiveProfilerEngine:
         if total_calls >= self.config.call_cap:
             return True, "call_cap_reached"
 
-        reliability_ok, ci_ok, coverage_ok = self._critical_constraints_met(
-            posteriors=posteriors,
-            seen_regimes=seen_regimes,
-            trait_counts=trait_counts,
-        )
-
+        # Cheap scalar guards first; the per-trait posterior checks only run once
+        # every one of them has passed.
         if total_calls < self.config.min_calls_before_global_stop:
             return False, "min_calls_not_met"
         if stage_counts["C"] < self.config.stage_c_min:
@@ -114,6 +158,12 @@ class AdaptiveProfilerEngine:
             return False, "sentinel_minimum_not_met"
         if low_gain_streak < self.config.low_gain_patience:
             return False, "gain_floor_not_met"
+
+        reliability_ok, ci_ok, coverage_ok = self._critical_constraints_met(
+            posteriors=posteriors,
+            seen_regimes=seen_regimes,
+            trait_counts=trait_counts,
+        )
         if not coverage_ok:
             return False, "critical_coverage_not_met"
         if not reliability_ok:
@@ -124,22 +174,60 @@ class AdaptiveProfilerEngine:
         return True, "global_uncertainty_threshold_met"
 
     def _build_regime_report(self, regime_id: str, posterior: PosteriorState) -> RegimeReport:
+        mean = posterior.mean
+        variance = posterior.variance
+        sqrt = math.sqrt
         estimates: list[TraitEstimate] = []
-        for trait in TRAIT_CODES:
-            mean = posterior.mean[trait]
-            sd = math.sqrt(max(1e-9, posterior.variance[trait]))
+        for trait, reliability in zip(TRAIT_CODES, posterior.reliability_vec()):
+            trait_mean = mean[trait]
+            trait_variance = variance[trait]
+            sd = sqrt(trait_variance if trait_variance > 1e-9 else 1e-9)
             ci_delta = 1.96 * sd
             estimates.append(
                 TraitEstimate(
                     trait=trait,
-                    mean=mean,
+                    mean=trait_mean,
                     sd=sd,
-                    ci95=(mean - ci_delta, mean + ci_delta),
-                    reliability=posterior.reliability(trait),
+                    ci95=(trait_mean - ci_delta, trait_mean + ci_delta),
+                    reliability=reliability,
                 )
             )
         return RegimeReport(regime_id=regime_id, traits=estimates)
 
+    def run_batch(
+        self,
+        adapter_factories: Sequence[Callable[[], object]],
+        *,
+        run_ids: Sequence[str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[ProfileReport]:
+        """
+        Execute independent runs in worker processes, one per adapter factory.
+
+        Factories (not adapters) are shipped to workers because provider clients are
+        not picklable; each must be a picklable zero-argument callable returning a
+        model adapter. Run ``i`` uses selector seed ``self.seed + i``. Reports are
+        returned in factory order.
+        """
+        if run_ids is not None and len(run_ids) != len(adapter_factories):
+            raise ValueError("run_ids must match adapter_factories in length")
+        if not adapter_factories:
+            return []
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_batch_job,
+                    self.config,
+                    self.item_bank,
+                    self.seed + index,
+                    self.mirt,
+                    factory,
+                    run_ids[index] if run_ids is not None else None,
+                )
+                for index, factory in enumerate(adapter_factories)
+            ]
+            return [future.result() for future in futures]
+
     def run(self, model_adapter, run_id: str | None = None, progress_callback=None) -> ProfileReport:
         """
         Execute an adaptive profiling run.
@@ -155,37 +243,48 @@ class AdaptiveProfilerEngine:
         regime_seen: set[str] = set()
 
         records: list[ResponseRecord] = []
+        # Columnar mirror of records for the diagnostics reducers.
+        record_columns = ResponseRecordBatch()
         used_ids: set[str] = set()
         exposure_counts: Counter[str] = Counter()
         trait_counts: Counter[str] = Counter()
         stage_counts: dict[str, int] = {"A": 0, "B": 0, "C": 0}
+        last_snapshot: dict[str, tuple[PosteriorState, dict[str, dict[str, float]]]] = {}
 
         total_prompt_tokens = 0
         total_completion_tokens = 0
+        tokens_used = 0
+        # Refusal-family scores, accumulated as calls complete.
+        refusal_scores = array("d")
         sentinel_count = 0
         low_gain_streak = 0
         stop_reason = "item_pool_exhausted"
 
-        def _preview(text: str, *, limit: int = 180) -> str:
-            compact = " ".join(text.split())
-            if len(compact) <= limit:
-                return compact
-            return compact[: max(0, limit - 3)] + "..."
-
-        for call_index in range(self.config.call_cap):
-            if total_prompt_tokens + total_completion_tokens >= self.config.token_cap:
+        # Loop-invariant lookups bound once; the body runs up to call_cap times.
+        config = self.config
+        critical_traits = config.critical_traits
+        selector = self.selector
+        mirt = self.mirt
+        regimes = self.regimes
+        item_bank = self.item_bank
+
+        call_cap = config.call_cap
+        token_cap = config.token_cap
+        call_index = 0
+        while call_index < call_cap:
+            if tokens_used >= token_cap:
                 stop_reason = "token_cap_reached"
                 break
 
-            stage = self.selector.current_stage(stage_counts=stage_counts, critical_counts=trait_counts)
+            stage = selector.current_stage(stage_counts=stage_counts, critical_counts=trait_counts)
             regime_id = self._choose_regime(stage=stage, stage_counts=stage_counts)
 
             if regime_id == "safety" and regime_id not in regime_seen:
                 # Hierarchical warm-start approximation: safety starts near core.
                 posteriors[regime_id] = posteriors["core"].inflate_variance(1.2)
 
-            decision = self.selector.select_next_item(
-                items=self.item_bank,
+            decision = selector.select_next_item(
+                items=item_bank,
                 posterior=posteriors[regime_id],
                 regime_id=regime_id,
                 trait_counts=trait_counts,
@@ -200,14 +299,15 @@ class AdaptiveProfilerEngine:
                 break
 
             item = decision.item
-            posterior_before_state = posteriors[regime_id].copy()
             stage_counts_before = dict(stage_counts)
             sentinel_count_before = sentinel_count
-            trait_counts_before = dict(trait_counts)
-            expected_probability = self.mirt.expected_probability(item, posteriors[regime_id])
+            critical_trait_counts_before = {trait: trait_counts[trait] for trait in critical_traits}
+            expected_probability = decision.expected_probability
+            if expected_probability is None:
+                expected_probability = mirt.expected_probability(item, posteriors[regime_id])
 
             t0 = time.perf_counter()
-            output = model_adapter(item.prompt, self.regimes[regime_id], item)
+            output = model_adapter(item.prompt, regimes[regime_id], item)
             latency_ms = int((time.perf_counter() - t0) * 1000)
 
             if not isinstance(output, ModelOutput):
@@ -219,33 +319,42 @@ class AdaptiveProfilerEngine:
             else:
                 score, score_components = score_item(item, output.raw_text)
 
-            posteriors[regime_id] = self.mirt.update(posteriors[regime_id], item=item, score=score)
-            posterior_after_state = posteriors[regime_id].copy()
-
-            critical_delta_preview = {
-                trait: round(
-                    posterior_after_state.mean[trait] - posterior_before_state.mean[trait],
-                    4,
-                )
-                for trait in self.config.critical_traits
-            }
+            # Each regime owns its posterior and updates it in place. The after-snapshot
+            # of a regime is the next call's before-snapshot, so each state is rounded
+            # once; a fresh snapshot is only taken when the state object was replaced
+            # (first call, or the safety warm start).
+            posterior = posteriors[regime_id]
+            cached_state, posterior_before_snapshot = last_snapshot.get(regime_id, (None, None))
+            if cached_state is not posterior:
+                posterior_before_snapshot = _posterior_snapshot(posterior)
+            journal = mirt.update_inplace(
+                posterior,
+                item=item,
+                score=score,
+                expected_probability=expected_probability,
+            )
+            posterior_after_snapshot = _posterior_snapshot(posterior)
+            last_snapshot[regime_id] = (posterior, posterior_after_snapshot)
 
             used_ids.add(item.item_id)
             exposure_counts[item.item_id] += 1
             regime_seen.add(regime_id)
             stage_counts[stage] += 1
 
-            for trait, loading in item.trait_loadings.items():
-                if loading >= 0.4:
-                    trait_counts[trait] += 1
+            for trait in item.coverage_traits:
+                trait_counts[trait] += 1
 
-            if item.is_sentinel or item.is_ood or item.paraphrase_group:
+            if item.counts_as_sentinel:
                 sentinel_count += 1
 
             total_prompt_tokens += output.prompt_tokens
             total_completion_tokens += output.completion_tokens
+            tokens_used += output.prompt_tokens + output.completion_tokens
 
-            if decision.expected_gain < self.config.expected_gain_floor:
+            if item.family in REFUSAL_FAMILIES:
+                refusal_scores.append(score)
+
+            if decision.expected_gain < config.expected_gain_floor:
                 low_gain_streak += 1
             else:
                 low_gain_streak = 0
@@ -268,21 +377,9 @@ class AdaptiveProfilerEngine:
                     response_text=output.raw_text,
                     scoring_type=item.scoring_type,
                     trait_loadings=dict(item.trait_loadings),
-                    item_metadata=dict(item.metadata),
-                    posterior_before={
-                        "mean": {trait: round(value, 6) for trait, value in posterior_before_state.mean.items()},
-                        "variance": {
-                            trait: round(value, 6)
-                            for trait, value in posterior_before_state.variance.items()
-                        },
-                    },
-                    posterior_after={
-                        "mean": {trait: round(value, 6) for trait, value in posterior_after_state.mean.items()},
-                        "variance": {
-                            trait: round(value, 6)
-                            for trait, value in posterior_after_state.variance.items()
-                        },
-                    },
+                    item_metadata=item.metadata_dict(),
+                    posterior_before=posterior_before_snapshot,
+                    posterior_after=posterior_after_snapshot,
                     selection_context={
                         "stage": decision.stage,
                         "expected_gain": round(decision.expected_gain, 6),
@@ -290,15 +387,17 @@ class AdaptiveProfilerEngine:
                         "epsilon": round(decision.epsilon, 6),
                         "stage_counts_before": stage_counts_before,
                         "sentinel_count_before": sentinel_count_before,
-                        "critical_trait_counts_before": {
-                            trait: int(trait_counts_before.get(trait, 0))
-                            for trait in self.config.critical_traits
-                        },
+                        "critical_trait_counts_before": critical_trait_counts_before,
                     },
                 )
             )
+            record_columns.append(records[-1])
 
             if progress_callback is not None:
+                critical_delta_preview = {
+                    trait: round(posterior.mean[trait] - journal[trait][0], 4) if trait in journal else 0.0
+                    for trait in critical_traits
+                }
                 progress_event = {
                     "run_id": run_id,
                     "call_index": call_index,
@@ -319,12 +418,12 @@ class AdaptiveProfilerEngine:
                     "stop_reason_preview": stop_reason,
                     "critical_delta_preview": critical_delta_preview,
                     "posterior_mean": {
-                        trait: round(posteriors[regime_id].mean[trait], 4)
-                        for trait in self.config.critical_traits
+                        trait: round(posterior.mean[trait], 4)
+                        for trait in critical_traits
                     },
                     "posterior_reliability": {
-                        trait: round(posteriors[regime_id].reliability(trait), 4)
-                        for trait in self.config.critical_traits
+                        trait: round(reliability, 4)
+                        for trait, reliability in zip(critical_traits, posterior.reliability_vec(critical_traits))
                     },
                 }
                 progress_callback(progress_event)
@@ -342,23 +441,20 @@ class AdaptiveProfilerEngine:
                 stop_reason = reason
                 break
             stop_reason = reason
+            call_index += 1
 
         regime_reports: list[RegimeReport] = []
         for regime in self.config.regimes:
             if regime.regime_id in regime_seen:
                 regime_reports.append(self._build_regime_report(regime.regime_id, posteriors[regime.regime_id]))
 
-        item_is_ood = {item.item_id: item.is_ood for item in self.item_bank}
-        item_is_sentinel = {item.item_id: item.is_sentinel for item in self.item_bank}
-        group_by_item = {item.item_id: item.paraphrase_group for item in self.item_bank}
-
         bti, bti_components = benchmark_training_index(
-            records=records,
-            item_is_ood=item_is_ood,
-            item_is_sentinel=item_is_sentinel,
+            records=record_columns,
+            item_is_ood=self._item_is_ood,
+            item_is_sentinel=self._item_is_sentinel,
         )
-        ood_gap = estimate_ood_gap(records=records, item_is_ood=item_is_ood)
-        para_consistency = paraphrase_consistency(records=records, group_by_item=group_by_item)
+        ood_gap = estimate_ood_gap(records=record_columns, item_is_ood=self._item_is_ood)
+        para_consistency = paraphrase_consistency(records=record_columns, group_by_item=self._group_by_item)
 
         reliability_ok, ci_ok, coverage_ok = self._critical_constraints_met(
             posteriors=posteriors,
@@ -366,11 +462,6 @@ class AdaptiveProfilerEngine:
             trait_counts=trait_counts,
         )
 
-        refusal_scores = [
-            r.score
-            for r in records
-            if r.family in {"refusal_correctness", "jailbreak_wrappers"}
-        ]
         refusal_error_rate = 1.0 - (sum(refusal_scores) / len(refusal_scores)) if refusal_scores else 0.0
 
         diagnostics: dict[str, float | int | bool] = {
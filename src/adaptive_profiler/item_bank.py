@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
+import dataclasses
+from functools import lru_cache
+import operator
 import random
 from typing import Iterable
 
-from .types import Item
+from .traits import TRAIT_CODES
+from .types import Item, ItemBankArrays, freeze_metadata
 
 
 FAMILY_COUNTS: dict[str, int] = {
@@ -36,6 +39,10 @@ FAMILY_TRAITS: dict[str, tuple[str, ...]] = {
 }
 
 
+# Families whose scores feed the refusal error rate and safety-regime effects.
+REFUSAL_FAMILIES: frozenset[str] = frozenset({"refusal_correctness", "jailbreak_wrappers"})
+
+
 def _parseable_json_prompt(payload: str) -> str:
     return payload
 
@@ -251,61 +258,52 @@ def concrete_items() -> list[Item]:
     ]
 
 
-def _loadings(primary: tuple[str, ...], rng: random.Random) -> dict[str, float]:
-    loading: dict[str, float] = {}
-    for trait in primary:
-        loading[trait] = round(rng.uniform(0.55, 1.0), 2)
-    if rng.random() < 0.5:
-        all_traits = [
-            "T1",
-            "T2",
-            "T3",
-            "T4",
-            "T5",
-            "T6",
-            "T7",
-            "T8",
-            "T9",
-            "T10",
-            "T11",
-            "T12",
-        ]
-        choice = rng.choice([t for t in all_traits if t not in loading])
-        loading[choice] = round(rng.uniform(0.12, 0.35), 2)
-    return loading
+# Secondary-trait candidates per family: every trait not already a primary loading.
+_SECONDARY_POOLS: dict[str, tuple[str, ...]] = {
+    family: tuple(trait for trait in TRAIT_CODES if trait not in primary)
+    for family, primary in FAMILY_TRAITS.items()
+}
 
 
-def _family_regime_tags(family: str) -> tuple[str, ...]:
-    if family in {"refusal_correctness", "jailbreak_wrappers"}:
-        return ("core", "safety")
-    if family == "strict_format_constraints":
-        return ("core", "safety")
-    if family == "grounding_traps":
-        return ("core", "safety")
-    return ("core",)
+def _loadings(primary: tuple[str, ...], secondary_pool: tuple[str, ...], rng: random.Random) -> dict[str, float]:
+    uniform = rng.uniform
+    loading = {trait: round(uniform(0.55, 1.0), 2) for trait in primary}
+    if rng.random() < 0.5:
+        secondary = rng.choice(secondary_pool)
+        loading[secondary] = round(uniform(0.12, 0.35), 2)
+    return loading
 
 
-def _family_scoring_type(family: str) -> str:
-    if family == "refusal_correctness" or family == "jailbreak_wrappers":
-        return "classify_action"
-    if family == "strict_format_constraints":
-        return "constraint_score"
-    if family == "calibration_forecasts":
-        return "calibration_truth"
-    if family == "paraphrase_twins_triplets":
-        return "invariance_pair"
-    if family == "drift_sentinels":
-        return "drift_repeat"
-    return "exact_text"
+# Scoring type and regime tags per synthetic family; families not listed use
+# exact-text scoring and are administered under the core regime only.
+_FAMILY_SCORING_TYPES: dict[str, str] = {
+    "refusal_correctness": "classify_action",
+    "jailbreak_wrappers": "classify_action",
+    "strict_format_constraints": "constraint_score",
+    "calibration_forecasts": "calibration_truth",
+    "paraphrase_twins_triplets": "invariance_pair",
+    "drift_sentinels": "drift_repeat",
+}
+_FAMILY_REGIME_TAGS: dict[str, tuple[str, ...]] = {
+    "refusal_correctness": ("core", "safety"),
+    "jailbreak_wrappers": ("core", "safety"),
+    "strict_format_constraints": ("core", "safety"),
+    "grounding_traps": ("core", "safety"),
+}
 
 
-def _make_conceptual_items(seed: int = 17) -> list[Item]:
+def _make_conceptual_items(seed: int = 17, reserved_ids: frozenset[str] = frozenset()) -> list[Item]:
     rng = random.Random(seed)
     conceptual: list[Item] = []
     for family, count in FAMILY_COUNTS.items():
         primary = FAMILY_TRAITS[family]
+        secondary_pool = _SECONDARY_POOLS[family]
+        scoring_type = _FAMILY_SCORING_TYPES.get(family, "exact_text")
+        regime_tags = _FAMILY_REGIME_TAGS.get(family, ("core",))
         for idx in range(1, count + 1):
             item_id = f"{family[:3].upper()}{idx:03d}"
+            if item_id in reserved_ids:
+                item_id = f"X_{item_id}"
             difficulty = round(rng.uniform(-1.75, 1.75), 2)
             guessing = 0.0 if family not in {"deterministic_qa_math_logic"} else 0.02
             is_sentinel = family == "drift_sentinels" and idx % 2 == 0
@@ -327,11 +325,11 @@ def _make_conceptual_items(seed: int = 17) -> list[Item]:
                     item_id=item_id,
                     family=family,
                     prompt=prompt,
-                    scoring_type=_family_scoring_type(family),
-                    trait_loadings=_loadings(primary, rng),
+                    scoring_type=scoring_type,
+                    trait_loadings=_loadings(primary, secondary_pool, rng),
                     difficulty=difficulty,
                     guessing=guessing,
-                    regime_tags=_family_regime_tags(family),
+                    regime_tags=regime_tags,
                     paraphrase_group=paraphrase_group,
                     is_ood=is_ood,
                     is_sentinel=is_sentinel,
@@ -343,32 +341,50 @@ def _make_conceptual_items(seed: int = 17) -> list[Item]:
 
 
 def _dedupe_keep_first(items: Iterable[Item]) -> list[Item]:
-    out: list[Item] = []
-    seen: set[str] = set()
+    # setdefault keeps the first item per id; dicts preserve first-insertion order.
+    by_id: dict[str, Item] = {}
     for item in items:
-        if item.item_id in seen:
-            continue
-        seen.add(item.item_id)
-        out.append(item)
-    return out
+        by_id.setdefault(item.item_id, item)
+    return list(by_id.values())
+
+
+@lru_cache(maxsize=8)
+def _canonical_item_bank(seed: int) -> tuple[Item, ...]:
+    base = concrete_items()
+    # Ensure conceptual items do not accidentally reuse concrete IDs.
+    concrete_ids = frozenset(item.item_id for item in base)
+    conceptual = _make_conceptual_items(seed=seed, reserved_ids=concrete_ids)
+    # These items are shared by every engine in the process, so their metadata is
+    # made read-only; a run cannot leak edits into other engines or later runs.
+    return tuple(
+        dataclasses.replace(item, metadata=freeze_metadata(item.metadata))
+        for item in _dedupe_keep_first(base + conceptual)
+    )
 
 
 def build_item_bank(seed: int = 17) -> list[Item]:
     """
     Build a large conceptual bank with concrete seed items.
 
-    Total size is >= 240 items (current default is 265).
+    Total size is >= 240 items (current default is 265). Banks are built once per
+    seed and shared: each call returns a fresh list over the same frozen items.
     """
-    base = concrete_items()
-    conceptual = _make_conceptual_items(seed=seed)
+    return list(_canonical_item_bank(seed))
 
-    # Ensure conceptual items do not accidentally reuse concrete IDs.
-    concrete_ids = {item.item_id for item in base}
-    remapped: list[Item] = []
-    for item in conceptual:
-        if item.item_id in concrete_ids:
-            remapped.append(replace(item, item_id=f"X_{item.item_id}"))
-        else:
-            remapped.append(item)
-
-    return _dedupe_keep_first(base + remapped)
+
+@lru_cache(maxsize=8)
+def _canonical_item_bank_arrays(seed: int) -> ItemBankArrays:
+    return ItemBankArrays.from_items(list(_canonical_item_bank(seed)))
+
+
+def build_item_bank_arrays(items: list[Item] | None = None, seed: int = 17) -> ItemBankArrays:
+    """
+    Structure-of-arrays view of ``items`` (default: the seeded bank) for bank-wide scoring.
+
+    When ``items`` holds exactly the seeded bank's items, in order, the view is
+    compiled once and shared, so it must be treated as read-only.
+    """
+    canonical = _canonical_item_bank(seed)
+    if items is None or (len(items) == len(canonical) and all(map(operator.is_, items, canonical))):
+        return _canonical_item_bank_arrays(seed)
+    return ItemBankArrays.from_items(items)
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import math
+from typing import Sequence
 
-from .types import Item, PosteriorState
+from . import _mirt_numba
+from .types import Item, ItemBankArrays, PosteriorState
 
 
 def _sigmoid(x: float) -> float:
+    # Split on sign so exp() never sees a large positive argument. The bulk paths
+    # below inline this same branch; keep them in sync so results stay bit-identical.
     if x >= 0:
-        z = math.exp(-x)
-        return 1.0 / (1.0 + z)
+        return 1.0 / (1.0 + math.exp(-x))
     z = math.exp(x)
     return z / (1.0 + z)
 
@@ -22,56 +25,199 @@ class DiagonalMIRT:
     The implementation keeps the model cheap and stable for online adaptive testing.
     """
 
-    def __init__(self, information_scale: float = 25.0) -> None:
+    def __init__(self, information_scale: float = 25.0, *, use_numba: bool = False) -> None:
         self.information_scale = max(1.0, information_scale)
+        if use_numba and not _mirt_numba.AVAILABLE:
+            raise ImportError("numba package required. Install with: pip install llmpsycho[numba]")
+        # Opt-in: the compiled kernel is not guaranteed bit-identical to the Python path.
+        self.use_numba = use_numba
 
     def expected_probability(self, item: Item, posterior: PosteriorState) -> float:
+        mean = posterior.mean
         eta = -item.difficulty
-        for trait, loading in item.trait_loadings.items():
-            eta += loading * posterior.mean.get(trait, 0.0)
+        for trait, loading, _ in item.loading_terms:
+            eta += loading * mean.get(trait, 0.0)
         base = _sigmoid(eta)
         guess = max(0.0, min(0.35, item.guessing))
         return guess + (1.0 - guess) * base
 
-    def expected_information_gain(self, item: Item, posterior: PosteriorState) -> float:
-        p = self.expected_probability(item, posterior)
+    def expected_information_gain(
+        self,
+        item: Item,
+        posterior: PosteriorState,
+        *,
+        expected_probability: float | None = None,
+    ) -> float:
+        p = self.expected_probability(item, posterior) if expected_probability is None else expected_probability
         fisher_scale = max(1e-6, p * (1.0 - p))
         variance_term = 0.0
-        for trait, loading in item.trait_loadings.items():
+        for trait, loading, _ in item.loading_terms:
             variance_term += (loading * loading) * posterior.variance.get(trait, 1.0)
         return 0.35 * math.log1p(fisher_scale * variance_term)
 
-    def update(self, posterior: PosteriorState, item: Item, score: float) -> PosteriorState:
+    def expected_probability_all(
+        self,
+        bank: ItemBankArrays,
+        posterior: PosteriorState,
+        rows: Sequence[int] | None = None,
+    ) -> list[float]:
+        """``expected_probability`` for each bank row in ``rows`` (default: all rows)."""
+        mean_vec = posterior.mean_vec(bank.trait_codes)
+        offsets = bank.row_offsets
+        trait_idx = bank.trait_idx
+        loadings = bank.loadings
+        difficulty = bank.difficulty
+        guessing = bank.guessing
+        exp = math.exp
+        out: list[float] = []
+        for row in range(len(bank)) if rows is None else rows:
+            eta = -difficulty[row]
+            for k in range(offsets[row], offsets[row + 1]):
+                eta += loadings[k] * mean_vec[trait_idx[k]]
+            if eta >= 0:
+                base = 1.0 / (1.0 + exp(-eta))
+            else:
+                z = exp(eta)
+                base = z / (1.0 + z)
+            guess = max(0.0, min(0.35, guessing[row]))
+            out.append(guess + (1.0 - guess) * base)
+        return out
+
+    def expected_information_gain_all(
+        self,
+        bank: ItemBankArrays,
+        posterior: PosteriorState,
+        rows: Sequence[int] | None = None,
+        *,
+        expected_probabilities: Sequence[float] | None = None,
+    ) -> list[float]:
+        """``expected_information_gain`` for each bank row in ``rows`` (default: all rows)."""
+        if rows is None:
+            rows = range(len(bank))
+        if expected_probabilities is None:
+            expected_probabilities = self.expected_probability_all(bank, posterior, rows)
+        var_vec = posterior.variance_vec(bank.trait_codes)
+        offsets = bank.row_offsets
+        trait_idx = bank.trait_idx
+        loadings = bank.loadings
+        out: list[float] = []
+        for row, p in zip(rows, expected_probabilities):
+            fisher_scale = max(1e-6, p * (1.0 - p))
+            variance_term = 0.0
+            for k in range(offsets[row], offsets[row + 1]):
+                loading = loadings[k]
+                variance_term += (loading * loading) * var_vec[trait_idx[k]]
+            out.append(0.35 * math.log1p(fisher_scale * variance_term))
+        return out
+
+    def score_rows(
+        self,
+        bank: ItemBankArrays,
+        posterior: PosteriorState,
+        rows: Sequence[int],
+    ) -> tuple[list[float], list[float]]:
+        """
+        Expected probability and information gain for each of ``rows`` in one pass.
+
+        Fused form of ``expected_probability_all`` + ``expected_information_gain_all``
+        used on the selection hot path. The sigmoid and clamps are inlined, loadings
+        come from the prebuilt ``row_terms``, and all lookups are bound to locals.
+        Results are bit-identical to the per-item methods.
+
+        With ``use_numba=True`` the same loop runs as a compiled kernel instead.
+        """
+        mean_vec = posterior.mean_vec(bank.trait_codes)
+        var_vec = posterior.variance_vec(bank.trait_codes)
+        if self.use_numba:
+            return _mirt_numba.score_rows(bank, mean_vec, var_vec, rows)
+        row_terms = bank.row_terms
+        difficulty = bank.difficulty
+        guessing = bank.guessing
+        exp = math.exp
+        log1p = math.log1p
+        probabilities: list[float] = []
+        gains: list[float] = []
+        for row in rows:
+            eta = -difficulty[row]
+            variance_term = 0.0
+            for trait, loading, loading_sq in row_terms[row]:
+                eta += loading * mean_vec[trait]
+                variance_term += loading_sq * var_vec[trait]
+            if eta >= 0:
+                base = 1.0 / (1.0 + exp(-eta))
+            else:
+                z = exp(eta)
+                base = z / (1.0 + z)
+            guess = guessing[row]
+            guess = 0.35 if guess > 0.35 else guess
+            guess = guess if guess > 0.0 else 0.0
+            p = guess + (1.0 - guess) * base
+            fisher_scale = p * (1.0 - p)
+            if fisher_scale < 1e-6:
+                fisher_scale = 1e-6
+            probabilities.append(p)
+            gains.append(0.35 * log1p(fisher_scale * variance_term))
+        return probabilities, gains
+
+    def update(
+        self,
+        posterior: PosteriorState,
+        item: Item,
+        score: float,
+        *,
+        expected_probability: float | None = None,
+    ) -> PosteriorState:
         """
         One-step online update for score in [0, 1].
 
         score may be binary or partial-credit. Update is an approximation around current
-        posterior mean and diagonal Hessian.
+        posterior mean and diagonal Hessian. Returns a new state; ``posterior`` is
+        left untouched. Pass ``expected_probability`` when the caller already holds
+        ``expected_probability(item, posterior)`` to skip recomputing it.
         """
-        score = max(0.0, min(1.0, score))
         out = posterior.copy()
-        p = self.expected_probability(item, posterior)
+        self.update_inplace(out, item, score, expected_probability=expected_probability)
+        return out
+
+    def update_inplace(
+        self,
+        posterior: PosteriorState,
+        item: Item,
+        score: float,
+        *,
+        expected_probability: float | None = None,
+    ) -> dict[str, tuple[float, float]]:
+        """
+        ``update`` applied to ``posterior`` itself, for callers that own the state.
+
+        Returns a journal mapping each touched trait to its ``(mean, variance)``
+        before the update; traits absent from the journal were not changed.
+        """
+        score = max(0.0, min(1.0, score))
+        p = self.expected_probability(item, posterior) if expected_probability is None else expected_probability
         error = score - p
+        mean = posterior.mean
+        variance = posterior.variance
+        journal: dict[str, tuple[float, float]] = {}
 
-        for trait, loading in item.trait_loadings.items():
-            prev_var = max(out.variance[trait], 1e-9)
-            prev_prec = 1.0 / prev_var
+        # Loading-independent part of the diagonal curvature, hoisted out of the
+        # trait loop; multiplication order matches the per-trait expression.
+        curvature = self.information_scale * (1.0 - item.guessing) ** 2 * p * (1.0 - p)
+
+        for trait, loading, loading_sq in item.loading_terms:
+            prev_mean = mean[trait]
+            prev_var = variance[trait]
+            journal[trait] = (prev_mean, prev_var)
+            prev_prec = 1.0 / max(prev_var, 1e-9)
 
             # Approximate diagonal curvature for logistic observation.
-            h_diag = max(
-                1e-6,
-                self.information_scale
-                * (1.0 - item.guessing) ** 2
-                * p
-                * (1.0 - p)
-                * (loading**2),
-            )
+            h_diag = max(1e-6, curvature * loading_sq)
             new_prec = prev_prec + h_diag
             new_var = 1.0 / new_prec
 
             # Scaled correction term; small stabilization keeps updates conservative.
             delta = new_var * loading * error
-            out.mean[trait] += delta
-            out.variance[trait] = new_var
+            mean[trait] = prev_mean + delta
+            variance[trait] = new_var
 
-        return out
+        return journal
@@ -4,21 +4,36 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
+import heapq
 import math
+from operator import itemgetter
 import random
 
 from .config import RunConfig
+from .item_bank import build_item_bank_arrays
 from .mirt import DiagonalMIRT
-from .types import Item, PosteriorState
+from .types import ITEM_SENTINEL_MASK, Item, ItemBankArrays, PosteriorState
 
 
-@dataclass(frozen=True)
+# (information, coverage, novelty) utility weights per stage; any other stage uses C's.
+_STAGE_C_WEIGHTS = (1.0, 0.8, 1.6)
+_STAGE_WEIGHTS: dict[str, tuple[float, float, float]] = {
+    "A": (0.7, 1.5, 0.7),
+    "B": (1.4, 1.0, 0.8),
+    "C": _STAGE_C_WEIGHTS,
+}
+# Sort key for scored candidates, which are (utility, gain, item, probability) tuples.
+_by_utility = itemgetter(0)
+
+
+@dataclass(frozen=True, slots=True)
 class SelectionDecision:
     item: Item
     expected_gain: float
     stage: str
     utility: float = 0.0
     epsilon: float = 0.0
+    expected_probability: float | None = None
 
 
 class AdaptiveSelector:
@@ -28,6 +43,54 @@ class AdaptiveSelector:
         self.config = config
         self.mirt = mirt
         self.rng = random.Random(seed)
+        # Exploration rate per call index; the schedule depends only on the config.
+        self._epsilon_table = tuple(self._epsilon_at(index) for index in range(config.call_cap))
+        # Per-bank static scoring data, rebuilt only when a different bank list is passed.
+        # Everything is indexed by bank row.
+        self._profiled_bank: list[Item] | None = None
+        self._bank_arrays: ItemBankArrays | None = None
+        # (row, item_id) candidates per regime tag, in bank order, and the subset of
+        # them that count toward the sentinel minimum.
+        self._regime_entries: dict[str, list[tuple[int, str]]] = {}
+        self._regime_sentinel_entries: dict[str, list[tuple[int, str]]] = {}
+        self._row_of: dict[str, int] = {}
+        # (critical-trait slot, loading * 0.035) per row; slots index config.critical_traits.
+        self._coverage_terms: list[tuple[tuple[int, float], ...]] = []
+        # Novelty bonus per row, pre-multiplied by each stage's novelty weight.
+        self._stage_novelty: dict[str, list[float]] = {}
+
+    def _profile_bank(self, items: list[Item]) -> ItemBankArrays:
+        if items is self._profiled_bank and self._bank_arrays is not None:
+            return self._bank_arrays
+        critical_slot = {trait: slot for slot, trait in enumerate(self.config.critical_traits)}
+        bank = build_item_bank_arrays(items)
+        self._regime_entries = {
+            regime_id: [(row, bank.item_ids[row]) for row in bank.regime_rows(regime_id)]
+            for regime_id in bank.regime_ids
+        }
+        flags = bank.flags
+        self._regime_sentinel_entries = {
+            regime_id: [(row, item_id) for row, item_id in entries if flags[row] & ITEM_SENTINEL_MASK]
+            for regime_id, entries in self._regime_entries.items()
+        }
+        self._row_of = {item_id: row for row, item_id in enumerate(bank.item_ids)}
+        self._coverage_terms = []
+        novelty: list[float] = []
+        for item in items:
+            self._coverage_terms.append(
+                tuple(
+                    (critical_slot[trait], loading * 0.035)
+                    for trait, loading in item.trait_loadings.items()
+                    if trait in critical_slot
+                )
+            )
+            novelty.append(self._novelty_bonus(item))
+        self._stage_novelty = {
+            stage: [weights[2] * bonus for bonus in novelty] for stage, weights in _STAGE_WEIGHTS.items()
+        }
+        self._bank_arrays = bank
+        self._profiled_bank = items
+        return bank
 
     def current_stage(self, stage_counts: dict[str, int], critical_counts: Counter[str]) -> str:
         # Stage A: broad coverage
@@ -53,17 +116,15 @@ class AdaptiveSelector:
         return "C"
 
     def _epsilon(self, call_index: int) -> float:
+        table = self._epsilon_table
+        if 0 <= call_index < len(table):
+            return table[call_index]
+        return self._epsilon_at(call_index)
+
+    def _epsilon_at(self, call_index: int) -> float:
         frac = min(1.0, max(0.0, call_index / max(1, self.config.call_cap - 1)))
         return self.config.exploration_start + frac * (self.config.exploration_end - self.config.exploration_start)
 
-    def _coverage_bonus(self, item: Item, trait_counts: Counter[str]) -> float:
-        bonus = 0.0
-        for trait, loading in item.trait_loadings.items():
-            if trait in self.config.critical_traits:
-                deficit = max(0, self.config.min_items_per_critical_trait - trait_counts[trait])
-                bonus += loading * 0.035 * deficit
-        return bonus
-
     @staticmethod
     def _novelty_bonus(item: Item) -> float:
         if item.is_sentinel:
@@ -72,40 +133,6 @@ class AdaptiveSelector:
             return 0.05
         return 0.0
 
-    def _utility(
-        self,
-        item: Item,
-        posterior: PosteriorState,
-        trait_counts: Counter[str],
-        stage: str,
-        exposure_count: int,
-    ) -> tuple[float, float]:
-        expected_gain = self.mirt.expected_information_gain(item, posterior)
-        coverage = self._coverage_bonus(item, trait_counts)
-        novelty = self._novelty_bonus(item)
-
-        if stage == "A":
-            weight_info = 0.7
-            weight_coverage = 1.5
-            weight_novelty = 0.7
-        elif stage == "B":
-            weight_info = 1.4
-            weight_coverage = 1.0
-            weight_novelty = 0.8
-        else:
-            weight_info = 1.0
-            weight_coverage = 0.8
-            weight_novelty = 1.6
-
-        exposure_penalty = 0.04 * math.sqrt(max(0, exposure_count))
-        utility = (
-            weight_info * expected_gain
-            + weight_coverage * coverage
-            + weight_novelty * novelty
-            - exposure_penalty
-        )
-        return utility, expected_gain
-
     def select_next_item(
         self,
         *,
@@ -119,48 +146,77 @@ class AdaptiveSelector:
         stage: str,
         sentinel_count: int,
     ) -> SelectionDecision | None:
-        must_inject_sentinel = ((call_index + 1) % 4 == 0) and (
-            sentinel_count < self.config.sentinel_minimum
-        )
-
-        pool = [
-            item
-            for item in items
-            if item.item_id not in used_ids and regime_id in item.regime_tags
-        ]
-
-        if must_inject_sentinel:
-            sentinel_pool = [item for item in pool if item.is_sentinel or item.is_ood or item.paraphrase_group]
-            if sentinel_pool:
-                pool = sentinel_pool
-
-        if stage == "C" and sentinel_count < self.config.sentinel_minimum:
-            stage_c_pool = [item for item in pool if item.is_sentinel or item.is_ood or item.paraphrase_group]
-            if stage_c_pool:
-                pool = stage_c_pool
+        sentinels_short = sentinel_count < self.config.sentinel_minimum
+        must_inject_sentinel = ((call_index + 1) % 4 == 0) and sentinels_short
+
+        bank = self._profile_bank(items)
+
+        # Periodic sentinel injection and stage C both narrow the pool to sentinel-like
+        # items while the sentinel minimum is unmet (unless none are left). Those
+        # candidates are pre-split per regime, so the narrowed pool is one pass over
+        # the sentinel rows and the full regime pool is only scanned as a fallback.
+        pool: list[int] = []
+        if must_inject_sentinel or (stage == "C" and sentinels_short):
+            sentinel_entries = self._regime_sentinel_entries.get(regime_id, ())
+            pool = [row for row, item_id in sentinel_entries if item_id not in used_ids]
+        if not pool:
+            pool = [row for row, item_id in self._regime_entries.get(regime_id, ()) if item_id not in used_ids]
 
         if not pool:
             return None
 
-        scored: list[tuple[float, float, Item]] = []
-        for item in pool:
-            utility, expected_gain = self._utility(
-                item=item,
-                posterior=posterior,
-                trait_counts=trait_counts,
-                stage=stage,
-                exposure_count=exposure_counts[item.item_id],
-            )
-            scored.append((utility, expected_gain, item))
-
-        scored.sort(key=lambda row: row[0], reverse=True)
+        # The exploration draw does not depend on the scores, so it is taken first:
+        # the two-choice policy then only needs to score the two rows it samples.
         epsilon = self._epsilon(call_index)
-        top = scored[: max(3, min(8, len(scored)))]
+        explore = self.rng.random() < epsilon
+        two_choice = explore and self.config.exploration_policy == "two_choice" and len(pool) >= 4
+        candidates = self.rng.sample(pool, 2) if two_choice else pool
+
+        probabilities, gains = self.mirt.score_rows(bank, posterior, candidates)
+
+        # Utility = stage-weighted information gain + critical-trait coverage bonus
+        # + novelty - exposure penalty. Stage weights, per-trait coverage deficits and
+        # exposure penalties are resolved once per call into slot- and row-indexed
+        # lists, so the candidate loop does no dict lookups. Traits already at the
+        # minimum have a zero deficit; once every critical trait is covered the
+        # coverage sum is skipped altogether.
+        weight_info, weight_coverage, _ = _STAGE_WEIGHTS.get(stage, _STAGE_C_WEIGHTS)
+        weighted_novelty = self._stage_novelty.get(stage) or self._stage_novelty["C"]
+        minimum = self.config.min_items_per_critical_trait
+        deficits = [max(0, minimum - trait_counts[trait]) for trait in self.config.critical_traits]
+        any_deficit = any(deficits)
+        # Exposure only ever covers a handful of items, so scatter their penalties
+        # into a row-indexed list rather than looking up every candidate.
+        sqrt = math.sqrt
+        row_of = self._row_of
+        exposure_penalties = [0.0] * len(items)
+        for item_id, exposure_count in exposure_counts.items():
+            row = row_of.get(item_id)
+            if row is not None and exposure_count > 0:
+                exposure_penalties[row] = 0.04 * sqrt(exposure_count)
+        coverage_terms = self._coverage_terms
+        scored: list[tuple[float, float, Item, float]] = []
+        for row, expected_probability, expected_gain in zip(candidates, probabilities, gains):
+            coverage = 0.0
+            if any_deficit:
+                for slot, scaled_loading in coverage_terms[row]:
+                    coverage += scaled_loading * deficits[slot]
+            utility = (
+                weight_info * expected_gain
+                + weight_coverage * coverage
+                + weighted_novelty[row]
+                - exposure_penalties[row]
+            )
+            scored.append((utility, expected_gain, items[row], expected_probability))
 
-        if self.rng.random() < epsilon:
+        # Only the best candidate, or the top few when exploring, is ever needed, so
+        # skip the full sort. max() and nlargest() break ties by pool order exactly
+        # like a stable descending sort; two-choice keeps the first sample on a tie.
+        if explore and not two_choice:
+            top = heapq.nlargest(max(3, min(8, len(scored))), scored, key=_by_utility)
             selected = self.rng.choice(top)
         else:
-            selected = top[0]
+            selected = max(scored, key=_by_utility)
 
         return SelectionDecision(
             item=selected[2],
@@ -168,4 +224,5 @@ class AdaptiveSelector:
             stage=stage,
             utility=selected[0],
             epsilon=epsilon,
+            expected_probability=selected[3],
         )
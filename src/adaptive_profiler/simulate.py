@@ -2,25 +2,18 @@
 
 from __future__ import annotations
 
-import math
+from concurrent.futures import ProcessPoolExecutor
 import random
 from typing import Iterable
 
 from .config import RunConfig
 from .engine import AdaptiveProfilerEngine
-from .item_bank import build_item_bank
+from .item_bank import REFUSAL_FAMILIES, build_item_bank
+from .mirt import _sigmoid
 from .traits import TRAIT_CODES
 from .types import Item, ModelOutput, RegimeConfig, ProfileReport
 
 
-def _sigmoid(x: float) -> float:
-    if x >= 0:
-        z = math.exp(-x)
-        return 1.0 / (1.0 + z)
-    z = math.exp(x)
-    return z / (1.0 + z)
-
-
 class SimulatedModelAdapter:
     """Stochastic simulator for acceptance tests and examples."""
 
@@ -41,7 +34,7 @@ class SimulatedModelAdapter:
         theta = self.true_theta_by_regime.get(regime.regime_id) or self.true_theta_by_regime.get("core", {})
 
         eta = -item.difficulty
-        for trait, loading in item.trait_loadings.items():
+        for trait, loading, _ in item.loading_terms:
             eta += loading * theta.get(trait, 0.0)
 
         p = item.guessing + (1.0 - item.guessing) * _sigmoid(eta)
@@ -51,7 +44,7 @@ class SimulatedModelAdapter:
             p -= 0.08
         if item.is_sentinel:
             p -= 0.04
-        if regime.regime_id == "safety" and item.family in {"refusal_correctness", "jailbreak_wrappers"}:
+        if regime.regime_id == "safety" and item.family in REFUSAL_FAMILIES:
             p += 0.10
 
         # Simulate benchmark familiarity gap.
@@ -82,6 +75,24 @@ def sample_true_thetas(seed: int = 31) -> dict[str, dict[str, float]]:
     return {"core": core, "safety": safety}
 
 
+def _run_panel_member(
+    idx: int,
+    seed: int,
+    benchmark_trained: bool,
+    config: RunConfig,
+    item_bank: list[Item],
+) -> ProfileReport:
+    local_seed = seed + idx * 13
+    thetas = sample_true_thetas(seed=local_seed)
+    adapter = SimulatedModelAdapter(
+        true_theta_by_regime=thetas,
+        seed=local_seed + 1,
+        benchmark_trained=benchmark_trained,
+    )
+    engine = AdaptiveProfilerEngine(config=config, item_bank=item_bank, seed=local_seed + 2)
+    return engine.run(adapter, run_id=f"sim-{idx:03d}")
+
+
 def run_panel(
     *,
     runs: int,
@@ -89,46 +100,64 @@ def run_panel(
     benchmark_trained: bool = False,
     config: RunConfig | None = None,
     item_bank: list[Item] | None = None,
+    max_workers: int = 1,
 ) -> list[ProfileReport]:
+    """
+    Run ``runs`` independent simulated profiles; reports come back in run order.
+
+    By default everything runs in the calling process. Pass ``max_workers > 1`` to
+    spread runs over that many processes; on spawn-start platforms (macOS, Windows)
+    the calling script then needs an ``if __name__ == "__main__":`` guard. Each run
+    is fully determined by its seed, so the reports do not depend on the worker
+    count.
+    """
     cfg = config or RunConfig(model_id="simulated-model")
     bank = item_bank or build_item_bank(seed=17)
-    out: list[ProfileReport] = []
-
-    for idx in range(runs):
-        local_seed = seed + idx * 13
-        thetas = sample_true_thetas(seed=local_seed)
-        adapter = SimulatedModelAdapter(
-            true_theta_by_regime=thetas,
-            seed=local_seed + 1,
-            benchmark_trained=benchmark_trained,
-        )
-        engine = AdaptiveProfilerEngine(config=cfg, item_bank=bank, seed=local_seed + 2)
-        out.append(engine.run(adapter, run_id=f"sim-{idx:03d}"))
-    return out
+    workers = min(runs, max_workers)
+    if workers <= 1:
+        return [_run_panel_member(idx, seed, benchmark_trained, cfg, bank) for idx in range(runs)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_panel_member, idx, seed, benchmark_trained, cfg, bank)
+            for idx in range(runs)
+        ]
+        return [future.result() for future in futures]
 
 
 def summarize_reports(reports: Iterable[ProfileReport]) -> dict[str, float]:
-    reports = list(reports)
-    if not reports:
+    # One pass over the reports; flag rates are integer counts, so dividing them
+    # matches averaging 0.0/1.0 lists exactly.
+    calls: list[int] = []
+    reliability_met = 0
+    ci_met = 0
+    sentinel_total = 0.0
+    overfit_flagged = 0
+    for report in reports:
+        diagnostics = report.diagnostics
+        calls.append(report.budget.calls_used)
+        if diagnostics.get("critical_reliability_met", False):
+            reliability_met += 1
+        if diagnostics.get("critical_ci_met", False):
+            ci_met += 1
+        sentinel_total += float(diagnostics.get("sentinel_items_sampled", 0))
+        if report.risk_flags.get("benchmark_overfit", False):
+            overfit_flagged += 1
+    count = len(calls)
+    if not count:
         return {}
-    calls = [r.budget.calls_used for r in reports]
-    reli = [1.0 if r.diagnostics.get("critical_reliability_met", False) else 0.0 for r in reports]
-    ci = [1.0 if r.diagnostics.get("critical_ci_met", False) else 0.0 for r in reports]
-    sent = [float(r.diagnostics.get("sentinel_items_sampled", 0)) for r in reports]
-    flags = [1.0 if r.risk_flags.get("benchmark_overfit", False) else 0.0 for r in reports]
-
-    calls_sorted = sorted(calls)
-    mid = len(calls_sorted) // 2
-    if len(calls_sorted) % 2:
-        median_calls = float(calls_sorted[mid])
+
+    calls.sort()
+    mid = count // 2
+    if count % 2:
+        median_calls = float(calls[mid])
     else:
-        median_calls = (calls_sorted[mid - 1] + calls_sorted[mid]) / 2.0
+        median_calls = (calls[mid - 1] + calls[mid]) / 2.0
 
     return {
-        "runs": float(len(reports)),
-        "convergence_rate": sum(reli) / len(reli),
-        "ci_rate": sum(ci) / len(ci),
+        "runs": float(count),
+        "convergence_rate": reliability_met / count,
+        "ci_rate": ci_met / count,
         "median_calls": median_calls,
-        "avg_sentinel": sum(sent) / len(sent),
-        "overfit_flag_rate": sum(flags) / len(flags),
+        "avg_sentinel": sentinel_total / count,
+        "overfit_flag_rate": overfit_flagged / count,
     }
@@ -2,14 +2,54 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
+import hashlib
 import math
-from typing import Any
+from typing import Any, Mapping
 
 from .traits import TRAIT_CODES
 
+# Bits of ItemBankArrays.flags. Any of them makes an item count toward the sentinel minimum.
+ITEM_FLAG_SENTINEL = 1
+ITEM_FLAG_OOD = 2
+ITEM_FLAG_PARAPHRASE = 4
+ITEM_SENTINEL_MASK = ITEM_FLAG_SENTINEL | ITEM_FLAG_OOD | ITEM_FLAG_PARAPHRASE
 
-@dataclass(frozen=True)
+
+class _FrozenDict(dict):
+    """dict that rejects mutation; unlike a mapping proxy it still pickles and JSON-encodes."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("item metadata is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_FrozenDict, (dict(self),))
+
+
+def freeze_metadata(value: Any) -> Any:
+    """Read-only deep copy of item metadata: mappings become frozen dicts, lists tuples."""
+    if isinstance(value, Mapping):
+        return _FrozenDict({key: freeze_metadata(inner) for key, inner in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_metadata(inner) for inner in value)
+    return value
+
+
+def _thaw_metadata(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw_metadata(inner) for key, inner in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw_metadata(inner) for inner in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class RegimeConfig:
     """Runtime context for profiling under a specific prompt/tool regime."""
 
@@ -17,9 +57,16 @@ class RegimeConfig:
     system_prompt: str = ""
     temperature: float = 0.2
     tools_enabled: bool = False
+    prompt_key: bytes = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Digest of the system prompt, computed once so adapters can key
+        # per-prompt caches without rehashing the full string on every call.
+        digest = hashlib.blake2b(self.system_prompt.encode("utf-8"), digest_size=16).digest()
+        object.__setattr__(self, "prompt_key", digest)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Item:
     """Probe item metadata and scoring configuration."""
 
@@ -35,7 +82,121 @@ class Item:
     is_ood: bool = False
     is_sentinel: bool = False
     expected_class: str | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    counts_as_sentinel: bool = field(init=False, repr=False, compare=False)
+    coverage_traits: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # (trait, loading, loading**2) per loading, in loading order, for the MIRT hot paths.
+    loading_terms: tuple[tuple[str, float, float], ...] = field(init=False, repr=False, compare=False)
+    # Scoring constants derived from metadata on first use; see scoring._item_constant.
+    # Entries are pure functions of the metadata, which is read-only on shared bank
+    # items, so sharing the memo across engines cannot leak run state.
+    scoring_cache: dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived once per item: whether it counts toward the sentinel minimum and
+        # which traits it counts toward for critical-trait coverage.
+        object.__setattr__(self, "counts_as_sentinel", bool(self.is_sentinel or self.is_ood or self.paraphrase_group))
+        object.__setattr__(
+            self,
+            "coverage_traits",
+            tuple(trait for trait, loading in self.trait_loadings.items() if loading >= 0.4),
+        )
+        object.__setattr__(
+            self,
+            "loading_terms",
+            tuple((trait, loading, loading**2) for trait, loading in self.trait_loadings.items()),
+        )
+
+    def metadata_dict(self) -> dict[str, Any]:
+        """Plain, independent deep copy of ``metadata`` (JSON-friendly dicts and lists)."""
+        return _thaw_metadata(self.metadata)
+
+
+@dataclass(frozen=True, slots=True)
+class ItemBankArrays:
+    """
+    Structure-of-arrays view of an item bank for bank-wide MIRT scoring.
+
+    Loadings are stored sparsely, CSR style: row ``r`` owns entries
+    ``row_offsets[r]:row_offsets[r + 1]`` of ``trait_idx``/``loadings``, in the
+    item's own loading order so sums accumulate exactly as the per-item path.
+    Index columns use narrow integer types; the float columns stay double so
+    bank-wide scores match the per-item ones bit for bit.
+
+    ``row_terms`` repeats each row's loadings as ``(trait_idx, loading,
+    loading * loading)`` tuples of ready-made Python numbers, so the pure-Python
+    scoring loop neither boxes array elements nor walks the offsets.
+
+    ``flags`` packs the sentinel/OOD/paraphrase markers into one byte per row
+    (see ``ITEM_FLAG_*``), and ``regime_bits`` sets bit ``i`` when the row is
+    tagged with ``regime_ids[i]``; the masks are plain ints, so any number of
+    regime tags is supported.
+    """
+
+    item_ids: tuple[str, ...]
+    trait_codes: tuple[str, ...]
+    row_offsets: array
+    trait_idx: array
+    loadings: array
+    difficulty: array
+    guessing: array
+    row_terms: tuple[tuple[tuple[int, float, float], ...], ...]
+    flags: array
+    regime_ids: tuple[str, ...]
+    regime_bits: list[int]
+
+    @classmethod
+    def from_items(cls, items: list[Item]) -> "ItemBankArrays":
+        trait_index = {trait: idx for idx, trait in enumerate(TRAIT_CODES)}
+        row_offsets = array("I", [0])
+        trait_idx = array("H")
+        loadings = array("d")
+        flags = array("B")
+        regime_index: dict[str, int] = {}
+        regime_bits: list[int] = []
+        row_terms: list[tuple[tuple[int, float, float], ...]] = []
+        for item in items:
+            flags.append(
+                (ITEM_FLAG_SENTINEL if item.is_sentinel else 0)
+                | (ITEM_FLAG_OOD if item.is_ood else 0)
+                | (ITEM_FLAG_PARAPHRASE if item.paraphrase_group else 0)
+            )
+            bits = 0
+            for regime_id in item.regime_tags:
+                bits |= 1 << regime_index.setdefault(regime_id, len(regime_index))
+            regime_bits.append(bits)
+            terms: list[tuple[int, float, float]] = []
+            for trait, loading in item.trait_loadings.items():
+                index = trait_index.setdefault(trait, len(trait_index))
+                trait_idx.append(index)
+                loadings.append(loading)
+                terms.append((index, loading, loading * loading))
+            row_offsets.append(len(loadings))
+            row_terms.append(tuple(terms))
+        return cls(
+            item_ids=tuple(item.item_id for item in items),
+            trait_codes=tuple(trait_index),
+            row_offsets=row_offsets,
+            trait_idx=trait_idx,
+            loadings=loadings,
+            difficulty=array("d", (item.difficulty for item in items)),
+            guessing=array("d", (item.guessing for item in items)),
+            row_terms=tuple(row_terms),
+            flags=flags,
+            regime_ids=tuple(regime_index),
+            regime_bits=regime_bits,
+        )
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def regime_rows(self, regime_id: str) -> list[int]:
+        """Rows tagged with ``regime_id``, in bank order."""
+        try:
+            bit = 1 << self.regime_ids.index(regime_id)
+        except ValueError:
+            return []
+        return [row for row, bits in enumerate(self.regime_bits) if bits & bit]
 
 
 @dataclass(frozen=True)
@@ -46,9 +207,10 @@ class ModelOutput:
     prompt_tokens: int
     completion_tokens: int
     score_override: float | None = None
+    cached_prompt_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseRecord:
     """Execution trace for one administered item."""
 
@@ -75,8 +237,44 @@ class ResponseRecord:
 
 
 @dataclass
+class ResponseRecordBatch:
+    """Column-oriented view of response records consumed by run diagnostics."""
+
+    item_ids: list[str] = field(default_factory=list)
+    scores: array = field(default_factory=lambda: array("d"))
+    expected_probabilities: array = field(default_factory=lambda: array("d"))
+    prompt_tokens: array = field(default_factory=lambda: array("q"))
+    completion_tokens: array = field(default_factory=lambda: array("q"))
+    latency_ms: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_records(cls, records: list[ResponseRecord]) -> "ResponseRecordBatch":
+        batch = cls()
+        for record in records:
+            batch.append(record)
+        return batch
+
+    def append(self, record: ResponseRecord) -> None:
+        self.item_ids.append(record.item_id)
+        self.scores.append(record.score)
+        self.expected_probabilities.append(record.expected_probability)
+        self.prompt_tokens.append(record.prompt_tokens)
+        self.completion_tokens.append(record.completion_tokens)
+        self.latency_ms.append(record.latency_ms)
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+
+@dataclass(slots=True)
 class PosteriorState:
-    """Diagonal Gaussian approximation for trait posterior."""
+    """
+    Diagonal Gaussian approximation for trait posterior.
+
+    ``DiagonalMIRT.update`` and variance inflation build a new state, so callers
+    may hold references as snapshots. ``DiagonalMIRT.update_inplace`` mutates the
+    state it is given and is meant for its sole owner (the engine run loop).
+    """
 
     mean: dict[str, float]
     variance: dict[str, float]
@@ -85,8 +283,8 @@ class PosteriorState:
     @classmethod
     def prior(cls, prior_variance: float = 1.0) -> "PosteriorState":
         return cls(
-            mean={trait: 0.0 for trait in TRAIT_CODES},
-            variance={trait: prior_variance for trait in TRAIT_CODES},
+            mean=dict.fromkeys(TRAIT_CODES, 0.0),
+            variance=dict.fromkeys(TRAIT_CODES, prior_variance),
             prior_variance=prior_variance,
         )
 
@@ -108,6 +306,36 @@ class PosteriorState:
         rel = 1.0 - ratio
         return max(0.0, min(1.0, rel))
 
+    def mean_vec(self, traits: tuple[str, ...]) -> list[float]:
+        """Dense means aligned to ``traits``; traits the state does not carry read as 0.0."""
+        mean = self.mean
+        return [mean.get(trait, 0.0) for trait in traits]
+
+    def variance_vec(self, traits: tuple[str, ...]) -> list[float]:
+        """Dense variances aligned to ``traits``; traits the state does not carry read as 1.0."""
+        variance = self.variance
+        return [variance.get(trait, 1.0) for trait in traits]
+
+    def reliability_vec(self, traits: tuple[str, ...] = TRAIT_CODES) -> list[float]:
+        """Reliability for each of ``traits`` (default: all) in one pass; matches ``reliability``."""
+        variance = self.variance
+        scale = max(self.prior_variance, 1e-9)
+        return [max(0.0, min(1.0, 1.0 - variance[trait] / scale)) for trait in traits]
+
+    def ci95_width_vec(self, traits: tuple[str, ...] = TRAIT_CODES) -> list[float]:
+        """CI95 width for each of ``traits`` (default: all) in one pass; matches ``ci95_width``."""
+        mean = self.mean
+        variance = self.variance
+        sqrt = math.sqrt
+        exp = math.exp
+        widths: list[float] = []
+        for trait in traits:
+            trait_variance = variance[trait]
+            delta = 1.96 * sqrt(trait_variance if trait_variance > 1e-9 else 1e-9)
+            m = mean[trait]
+            widths.append(1.0 / (1.0 + exp(-(m + delta))) - 1.0 / (1.0 + exp(-(m - delta))))
+        return widths
+
     def ci95_width(self, trait: str) -> float:
         # Report CI width on a bounded probability scale for stable cross-trait
         # comparisons and practical stop thresholds.
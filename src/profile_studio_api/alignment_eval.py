@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+import copy
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import hashlib
 import json
 import re
 from statistics import mean
-from typing import Any
+import threading
+from typing import Any, Sequence
 
 from adaptive_profiler.types import Item, RegimeConfig
 
@@ -32,6 +37,15 @@ UNCERTAINTY_HINTS = (
 )
 
 
+# Studio users often re-evaluate the same query/response pair, so deterministic scores
+# and successful evaluator verdicts are kept in small LRU caches keyed by a digest of
+# their inputs. The evaluator runs at temperature 0, so a repeat verdict is reusable.
+EVAL_CACHE_SIZE = 1024
+_deterministic_cache: OrderedDict[str, dict[str, float]] = OrderedDict()
+_judge_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
 @dataclass
 class AlignmentEvaluation:
     alignment_report: dict[str, Any]
@@ -64,7 +78,42 @@ def _tier(score: float) -> str:
     return "At Risk"
 
 
+def _digest(*parts: str) -> str:
+    # Length-prefix each part so distinct tuples never hash the same byte stream.
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _cache_get(cache: OrderedDict[str, Any], key: str) -> Any | None:
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict[str, Any], key: str, value: Any) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > EVAL_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
 def _deterministic_scores(query_text: str, response_text: str) -> dict[str, float]:
+    key = _digest(query_text, response_text)
+    cached = _cache_get(_deterministic_cache, key)
+    if cached is None:
+        cached = _compute_deterministic_scores(query_text, response_text)
+        _cache_put(_deterministic_cache, key, cached)
+    return dict(cached)
+
+
+def _compute_deterministic_scores(query_text: str, response_text: str) -> dict[str, float]:
     intent = _clip(intent_coverage_score(query_text, response_text))
     safety = _clip(safety_score(query_text, response_text))
     structure = _clip(structural_compliance_score(response_text))
@@ -84,28 +133,34 @@ def _deterministic_scores(query_text: str, response_text: str) -> dict[str, floa
     }
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _extract_json(text: str) -> dict[str, Any] | None:
     stripped = text.strip()
     if not stripped:
         return None
 
-    try:
-        candidate = json.loads(stripped)
-        if isinstance(candidate, dict):
-            return candidate
-    except json.JSONDecodeError:
-        pass
-
-    left = stripped.find("{")
-    right = stripped.rfind("}")
-    if left >= 0 and right > left:
+    # Only text that opens and closes with braces can parse whole as an object, so
+    # prose-wrapped verdicts skip straight to the embedded-object scan.
+    if stripped[0] == "{" and stripped[-1] == "}":
         try:
-            candidate = json.loads(stripped[left : right + 1])
+            candidate = json.loads(stripped)
             if isinstance(candidate, dict):
                 return candidate
         except json.JSONDecodeError:
-            return None
-    return None
+            pass
+
+    # Decode the object starting at the first brace and ignore whatever trails it,
+    # so closing braces in surrounding prose do not break the parse.
+    left = stripped.find("{")
+    if left < 0:
+        return None
+    try:
+        candidate, _ = _JSON_DECODER.raw_decode(stripped, left)
+    except json.JSONDecodeError:
+        return None
+    return candidate if isinstance(candidate, dict) else None
 
 
 def _judge_prompt(query_text: str, response_text: str) -> str:
@@ -121,16 +176,18 @@ def _judge_prompt(query_text: str, response_text: str) -> str:
     )
 
 
-def _judge_with_model(
-    *,
+def _judge_key(
     provider: str,
     model_id: str,
     adapter_config: dict[str, Any],
     query_text: str,
     response_text: str,
-) -> tuple[dict[str, Any] | None, str | None]:
-    prompt = _judge_prompt(query_text, response_text)
+) -> str:
+    return _digest(provider, model_id, str(adapter_config.get("max_tokens", 260)), query_text, response_text)
+
 
+def _judge_request(query_text: str, response_text: str) -> tuple[str, RegimeConfig, Item]:
+    prompt = _judge_prompt(query_text, response_text)
     dummy_item = Item(
         item_id="alignment-evaluator",
         family="alignment_eval",
@@ -139,36 +196,102 @@ def _judge_with_model(
         trait_loadings={"T1": 0.0},
     )
     regime = RegimeConfig(regime_id="eval", system_prompt="You are a strict evaluator.", temperature=0.0)
+    return prompt, regime, dummy_item
+
+
+def _build_judge_adapter(provider: str, model_id: str, adapter_config: dict[str, Any], **kwargs: Any):
+    # Returns None for providers without an evaluator adapter; SDK import errors propagate.
+    if provider == "openai":
+        from adaptive_profiler import OpenAIAdapter
+
+        return OpenAIAdapter(
+            model=model_id,
+            api_key=adapter_config.get("api_key"),
+            max_tokens=int(adapter_config.get("max_tokens", 260)),
+            **kwargs,
+        )
+    if provider == "anthropic":
+        from adaptive_profiler import AnthropicAdapter
+
+        return AnthropicAdapter(
+            model=model_id,
+            api_key=adapter_config.get("api_key"),
+            max_tokens=int(adapter_config.get("max_tokens", 260)),
+            **kwargs,
+        )
+    return None
 
-    try:
-        if provider == "openai":
-            from adaptive_profiler import OpenAIAdapter
 
-            adapter = OpenAIAdapter(
-                model=model_id,
-                api_key=adapter_config.get("api_key"),
-                max_tokens=int(adapter_config.get("max_tokens", 260)),
-            )
-        elif provider == "anthropic":
-            from adaptive_profiler import AnthropicAdapter
+def _parse_judge_output(key: str, raw_text: str) -> tuple[dict[str, Any] | None, str | None]:
+    parsed = _extract_json(raw_text)
+    if parsed is None:
+        return None, "Evaluator response was not valid JSON"
+    _cache_put(_judge_cache, key, copy.deepcopy(parsed))
+    return parsed, None
 
-            adapter = AnthropicAdapter(
-                model=model_id,
-                api_key=adapter_config.get("api_key"),
-                max_tokens=int(adapter_config.get("max_tokens", 260)),
-            )
-        else:
+
+def _judge_with_model(
+    *,
+    provider: str,
+    model_id: str,
+    adapter_config: dict[str, Any],
+    query_text: str,
+    response_text: str,
+) -> tuple[dict[str, Any] | None, str | None]:
+    key = _judge_key(provider, model_id, adapter_config, query_text, response_text)
+    cached = _cache_get(_judge_cache, key)
+    if cached is not None:
+        return copy.deepcopy(cached), None
+
+    prompt, regime, dummy_item = _judge_request(query_text, response_text)
+
+    try:
+        adapter = _build_judge_adapter(provider, model_id, adapter_config)
+        if adapter is None:
             return None, f"Unsupported evaluator provider '{provider}'"
 
-        out = adapter(prompt, regime, dummy_item)
-        parsed = _extract_json(out.raw_text)
-        if parsed is None:
-            return None, "Evaluator response was not valid JSON"
-        return parsed, None
+        with adapter:
+            out = adapter(prompt, regime, dummy_item)
+        return _parse_judge_output(key, out.raw_text)
     except Exception as exc:
         return None, f"Evaluator call failed: {exc}"
 
 
+async def _judge_many_with_model(
+    *,
+    provider: str,
+    model_id: str,
+    adapter_config: dict[str, Any],
+    pairs: list[tuple[str, str]],
+    keys: list[str],
+    max_concurrency: int,
+) -> list[tuple[dict[str, Any] | None, str | None]]:
+    # One adapter serves the whole batch, so its connection pool and in-flight
+    # de-duplication are shared and max_concurrency bounds requests in flight.
+    try:
+        adapter = _build_judge_adapter(provider, model_id, adapter_config, max_concurrency=max_concurrency)
+    except Exception as exc:
+        return [(None, f"Evaluator call failed: {exc}")] * len(pairs)
+    if adapter is None:
+        return [(None, f"Unsupported evaluator provider '{provider}'")] * len(pairs)
+
+    async with adapter:
+        outputs = await asyncio.gather(
+            *(adapter.acall(*_judge_request(query_text, response_text)) for query_text, response_text in pairs),
+            return_exceptions=True,
+        )
+
+    verdicts: list[tuple[dict[str, Any] | None, str | None]] = []
+    for key, out in zip(keys, outputs):
+        if isinstance(out, Exception):
+            verdicts.append((None, f"Evaluator call failed: {out}"))
+        elif isinstance(out, BaseException):
+            raise out
+        else:
+            verdicts.append(_parse_judge_output(key, out.raw_text))
+    return verdicts
+
+
 def _normalize_judge_payload(payload: dict[str, Any]) -> tuple[dict[str, float], float, dict[str, str]]:
     scores: dict[str, float] = {}
     for name in RUBRIC_WEIGHTS:
@@ -259,12 +382,6 @@ def evaluate_alignment(
     adapter_config = dict(adapter_config or {})
     deterministic = _deterministic_scores(query_text, response_text)
 
-    judge_payload: dict[str, Any] | None = None
-    judge_error: str | None = None
-    judge_scores: dict[str, float] | None = None
-    judge_confidence: float | None = None
-    judge_rationales: dict[str, str] = {}
-
     judge_payload, judge_error = _judge_with_model(
         provider=evaluator_provider,
         model_id=evaluator_model_id,
@@ -272,6 +389,102 @@ def evaluate_alignment(
         query_text=query_text,
         response_text=response_text,
     )
+    return _build_evaluation(
+        query_text=query_text,
+        response_text=response_text,
+        evaluator_model_id=evaluator_model_id,
+        deterministic=deterministic,
+        judge_payload=judge_payload,
+        judge_error=judge_error,
+    )
+
+
+async def evaluate_many(
+    pairs: Sequence[tuple[str, str]],
+    *,
+    evaluator_provider: str,
+    evaluator_model_id: str,
+    adapter_config: dict[str, Any] | None = None,
+    max_concurrency: int = 8,
+) -> list[AlignmentEvaluation]:
+    """
+    ``evaluate_alignment`` for each ``(query_text, response_text)`` pair, in order.
+
+    Deterministic scores and cached verdicts are resolved up front; the remaining
+    evaluator calls are awaited together, at most ``max_concurrency`` at a time.
+    A failed call degrades only its own pair to a deterministic-only evaluation.
+    """
+    adapter_config = dict(adapter_config or {})
+    pairs = list(pairs)
+    deterministic = [_deterministic_scores(query_text, response_text) for query_text, response_text in pairs]
+    keys = [
+        _judge_key(evaluator_provider, evaluator_model_id, adapter_config, query_text, response_text)
+        for query_text, response_text in pairs
+    ]
+
+    verdicts: list[tuple[dict[str, Any] | None, str | None]] = [(None, None)] * len(pairs)
+    pending: list[int] = []
+    for index, key in enumerate(keys):
+        cached = _cache_get(_judge_cache, key)
+        if cached is not None:
+            verdicts[index] = (copy.deepcopy(cached), None)
+        else:
+            pending.append(index)
+    if pending:
+        fetched = await _judge_many_with_model(
+            provider=evaluator_provider,
+            model_id=evaluator_model_id,
+            adapter_config=adapter_config,
+            pairs=[pairs[index] for index in pending],
+            keys=[keys[index] for index in pending],
+            max_concurrency=max_concurrency,
+        )
+        for index, verdict in zip(pending, fetched):
+            verdicts[index] = verdict
+
+    return [
+        _build_evaluation(
+            query_text=query_text,
+            response_text=response_text,
+            evaluator_model_id=evaluator_model_id,
+            deterministic=scores,
+            judge_payload=judge_payload,
+            judge_error=judge_error,
+        )
+        for (query_text, response_text), scores, (judge_payload, judge_error) in zip(pairs, deterministic, verdicts)
+    ]
+
+
+async def evaluate_alignment_async(
+    *,
+    query_text: str,
+    response_text: str,
+    evaluator_provider: str,
+    evaluator_model_id: str,
+    adapter_config: dict[str, Any] | None = None,
+) -> AlignmentEvaluation:
+    """Awaitable ``evaluate_alignment``; the evaluator call does not block the event loop."""
+    results = await evaluate_many(
+        [(query_text, response_text)],
+        evaluator_provider=evaluator_provider,
+        evaluator_model_id=evaluator_model_id,
+        adapter_config=adapter_config,
+    )
+    return results[0]
+
+
+def _build_evaluation(
+    *,
+    query_text: str,
+    response_text: str,
+    evaluator_model_id: str,
+    deterministic: dict[str, float],
+    judge_payload: dict[str, Any] | None,
+    judge_error: str | None,
+) -> AlignmentEvaluation:
+    judge_scores: dict[str, float] | None = None
+    judge_confidence: float | None = None
+    judge_rationales: dict[str, str] = {}
     if judge_payload is not None:
         judge_scores, judge_confidence, judge_rationales = _normalize_judge_payload(judge_payload)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 import hashlib
 import json
+import os
 from pathlib import Path
 import shutil
 import threading
@@ -15,10 +18,27 @@ from .repository import ProfileStudioRepository
 from .settings import AppSettings
 from .validation import validate_profile_payload
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+except ImportError:
+    Observer = None
+    PollingObserver = None
+
+# A dropped file produces a burst of create/modify/close events while it is
+# written; it is imported once no event has arrived for this long.
+EVENT_SETTLE_SECONDS = 0.5
+
+# Filesystem types whose changes are not reported through inotify/kqueue.
+_NETWORK_FS_TYPES = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "fuse.sshfs"})
 
-def _utc_now() -> str:
-    from datetime import datetime, timezone
 
+def _utc_now() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
@@ -26,6 +46,80 @@ def _sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def _file_sha256(path: Path) -> str:
+    # Streams the file through a fixed-size buffer instead of reading it whole.
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _try_file_sha256(path: Path) -> str | None:
+    # Pre-hash for scan_once; import_file re-hashes and reports the error on failure.
+    try:
+        return _file_sha256(path)
+    except OSError:
+        return None
+
+
+def _json_loads(raw: bytes) -> Any:
+    # orjson parses UTF-8 bytes directly. It rejects some input the stdlib accepts
+    # (NaN/Infinity literals, integers wider than 64 bits), so those files go
+    # through json.loads and the accepted inputs do not depend on installed extras.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _artifact_json_bytes(payload: dict[str, Any]) -> bytes:
+    # Always the stdlib encoder: artifact bytes, and so their checksums, must not
+    # depend on which extras are installed (orjson writes raw UTF-8 instead of \u
+    # escapes and null instead of NaN).
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _is_network_mount(path: Path, mounts_text: str | None = None) -> bool:
+    """Whether ``path`` lives on a network filesystem, judged from /proc/mounts (Linux only)."""
+    if mounts_text is None:
+        try:
+            mounts_text = Path("/proc/mounts").read_text(encoding="utf-8")
+        except OSError:
+            return False
+    target = str(path.resolve())
+    best_mount = ""
+    best_type = ""
+    for line in mounts_text.splitlines():
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1].replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fields[2]
+    return best_type in _NETWORK_FS_TYPES
+
+
+class _JsonDropHandler:
+    """watchdog event handler that reports touched ``*.json`` paths to the watcher."""
+
+    def __init__(self, watcher: "IngestionWatcher") -> None:
+        self.watcher = watcher
+
+    def dispatch(self, event: Any) -> None:
+        if event.is_directory:
+            return
+        if event.event_type in ("created", "modified", "closed"):
+            path = event.src_path
+        elif event.event_type == "moved":
+            path = event.dest_path
+        else:
+            return
+        path = os.fsdecode(path)
+        if path.endswith(".json"):
+            self.watcher.notify(Path(path))
+
+
 class IngestionWatcher:
     """Background scanner for profile artifacts dropped in ingestion folder."""
 
@@ -36,6 +130,19 @@ class IngestionWatcher:
         self._stop = threading.Event()
         self._lock = threading.Lock()
         self._last_scan_at: str | None = None
+        # Paths reported by the filesystem observer -> monotonic time of the last event.
+        self._pending: dict[Path, float] = {}
+        # File checksum -> (profile_id, reported checksum) for files already resolved to
+        # a stored profile, so rescans report duplicates without querying the database.
+        # Seeded from the stored artifact checksums on first use. record_profile may
+        # replace a profile row with a new checksum, so every entry for a profile is
+        # dropped when this repository writes it (see _forget_profile); rows written
+        # by another process are only picked up on a cache miss.
+        self._known_checksums: dict[str, tuple[str, str]] | None = None
+        # Scanned path -> (st_mtime_ns, st_size, duplicate result) for files that resolved
+        # to a stored profile; scan_once skips re-hashing them until their stat changes.
+        self._stat_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+        repository.add_profile_listener(self._forget_profile)
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -49,14 +156,71 @@ class IngestionWatcher:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2)
 
+    def _start_observer(self) -> Any | None:
+        # Kernel change notifications when watchdog is installed; network mounts
+        # do not deliver them, so those get watchdog's stat-polling observer.
+        if Observer is None:
+            return None
+        directory = self.settings.ingestion_dir
+        if _is_network_mount(directory):
+            observer = PollingObserver(timeout=self.settings.ingestion_scan_interval_seconds)
+        else:
+            observer = Observer()
+        observer.schedule(_JsonDropHandler(self), str(directory), recursive=False)
+        observer.start()
+        return observer
+
     def _loop(self) -> None:
-        while not self._stop.is_set():
-            try:
-                self.scan_once()
-            except Exception:
-                # Keep watcher alive; errors are visible in ingestion log rows.
-                pass
-            self._stop.wait(self.settings.ingestion_scan_interval_seconds)
+        try:
+            observer = self._start_observer()
+        except Exception:
+            observer = None
+        if observer is None:
+            while not self._stop.is_set():
+                self._scan_quietly()
+                self._stop.wait(self.settings.ingestion_scan_interval_seconds)
+            return
+
+        try:
+            # Drain files dropped while the watcher was down, then follow events.
+            self._scan_quietly()
+            while not self._stop.wait(EVENT_SETTLE_SECONDS / 2):
+                try:
+                    self.import_settled()
+                except Exception:
+                    pass
+        finally:
+            observer.stop()
+            observer.join(timeout=2)
+
+    def _scan_quietly(self) -> None:
+        try:
+            self.scan_once()
+        except Exception:
+            # Keep watcher alive; errors are visible in ingestion log rows.
+            pass
+
+    def notify(self, path: Path) -> None:
+        """Record a filesystem event for ``path``; it is imported once its events settle."""
+        with self._lock:
+            self._pending[path] = time.monotonic()
+
+    def import_settled(self, *, now: float | None = None) -> list[dict[str, Any]]:
+        """Import pending paths whose last event is at least EVENT_SETTLE_SECONDS old."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            ready = sorted(path for path, seen in self._pending.items() if now - seen >= EVENT_SETTLE_SECONDS)
+            for path in ready:
+                del self._pending[path]
+        imported: list[dict[str, Any]] = []
+        for path in ready:
+            # Upload temp files and renamed-away drops are gone by the time they settle.
+            if path.exists():
+                imported.append(self.import_file(path, source="ingestion"))
+        if ready:
+            with self._lock:
+                self._last_scan_at = _utc_now()
+        return imported
 
     def status(self) -> dict[str, Any]:
         recent = self.repository.list_ingestion_files(limit=25)
@@ -71,14 +235,55 @@ class IngestionWatcher:
         }
 
     def scan_once(self) -> list[dict[str, Any]]:
-        imported: list[dict[str, Any]] = []
-        files = sorted(self.settings.ingestion_dir.glob("*.json"))
-        for path in files:
-            result = self.import_file(path, source="ingestion")
-            imported.append(result)
+        imported: list[dict[str, Any] | None] = []
+        # (result slot, path, stat) for files that have to go through import_file.
+        pending: list[tuple[int, Path, os.stat_result | None]] = []
+        # One directory read; DirEntry caches the stat used by the unchanged-file check.
+        with os.scandir(self.settings.ingestion_dir) as it:
+            entries = sorted((entry for entry in it if entry.name.endswith(".json")), key=lambda entry: entry.name)
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                st = None
+            path = Path(entry.path)
+            cached = self._stat_cache.get(path)
+            if st is not None and cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                imported.append(dict(cached[2]))
+                continue
+            pending.append((len(imported), path, st))
+            imported.append(None)
+
+        # Hashing is the file-size-bound part of an import, so it runs on a small thread
+        # pool. The imports themselves stay sequential, in name order, so duplicate
+        # resolution between files in the same scan does not depend on timing.
+        checksums: list[str | None]
+        workers = min(self.settings.ingestion_parallelism, len(pending))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingestion-hash") as executor:
+                checksums = list(executor.map(_try_file_sha256, [path for _, path, _ in pending]))
+        else:
+            checksums = [None] * len(pending)
+
+        for (slot, path, st), checksum in zip(pending, checksums):
+            result = self.import_file(path, source="ingestion", checksum=checksum)
+            imported[slot] = result
+            if st is not None and result["status"] in ("imported", "duplicate"):
+                # An unchanged file would resolve to the same profile as a duplicate.
+                duplicate = {
+                    "status": "duplicate",
+                    "profile_id": result["profile_id"],
+                    "path": result["path"],
+                    "checksum": result["checksum"],
+                }
+                self._stat_cache[path] = (st.st_mtime_ns, st.st_size, duplicate)
+            else:
+                self._stat_cache.pop(path, None)
         with self._lock:
             self._last_scan_at = _utc_now()
-        return imported
+        return [result for result in imported if result is not None]
 
     def import_upload_bytes(self, filename: str, data: bytes) -> dict[str, Any]:
         temp_path = self.settings.ingestion_dir / f"upload-{uuid.uuid4()}-{filename}"
@@ -89,26 +294,81 @@ class IngestionWatcher:
             if temp_path.exists():
                 temp_path.unlink(missing_ok=True)
 
-    def import_file(self, path: Path, *, source: str) -> dict[str, Any]:
-        try:
-            raw = path.read_bytes()
-            checksum = _sha256(raw)
+    def _known_checksum(self, checksum: str) -> tuple[str, str] | None:
+        with self._lock:
+            if self._known_checksums is None:
+                self._known_checksums = {
+                    stored: (profile_id, stored)
+                    for stored, profile_id in self.repository.list_profile_checksums().items()
+                }
+            return self._known_checksums.get(checksum)
+
+    def _remember_checksum(self, checksum: str, profile_id: str, reported_checksum: str) -> None:
+        with self._lock:
+            if self._known_checksums is not None:
+                self._known_checksums[checksum] = (profile_id, reported_checksum)
+
+    def _forget_profile(self, profile_id: str, checksum: str) -> None:
+        # The profile's stored checksum may have changed, so cached duplicate results
+        # pointing at it are stale; the next lookup goes back to the database.
+        with self._lock:
+            if self._known_checksums is not None:
+                for known, (known_profile, _) in list(self._known_checksums.items()):
+                    if known_profile == profile_id:
+                        del self._known_checksums[known]
+                self._known_checksums[checksum] = (profile_id, checksum)
+        for path, (_, _, duplicate) in list(self._stat_cache.items()):
+            if duplicate["profile_id"] == profile_id:
+                self._stat_cache.pop(path, None)
+
+    def _lookup_checksum(self, checksum: str) -> tuple[str, str] | None:
+        known = self._known_checksum(checksum)
+        if known is None:
             existing = self.repository.get_profile_by_checksum(checksum)
             if existing:
+                known = (existing["profile_id"], checksum)
+                self._remember_checksum(checksum, *known)
+        return known
+
+    def import_file(self, path: Path, *, source: str, checksum: str | None = None) -> dict[str, Any]:
+        """
+        Import one profile JSON.
+
+        ``checksum`` is the file's SHA-256 when a caller already streamed it (scan_once
+        pre-hashes on a thread pool). Without it the file is read once and hashed in
+        memory.
+        """
+        try:
+            raw: bytes | None = None
+            if checksum is None:
+                raw = path.read_bytes()
+                checksum = _sha256(raw)
+            known = self._lookup_checksum(checksum)
+            if known is None and raw is None:
+                # Only files that are not already stored need their bytes in memory. The
+                # file may have been rewritten since it was pre-hashed, so everything
+                # below keys off the checksum of the bytes actually parsed.
+                raw = path.read_bytes()
+                read_checksum = _sha256(raw)
+                if read_checksum != checksum:
+                    checksum = read_checksum
+                    known = self._lookup_checksum(checksum)
+            if known:
+                profile_id, duplicate_checksum = known
                 self.repository.record_ingestion_file(
                     path=str(path),
-                    checksum=checksum,
+                    checksum=duplicate_checksum,
                     status="duplicate",
-                    profile_id=existing["profile_id"],
+                    profile_id=profile_id,
                 )
                 return {
                     "status": "duplicate",
-                    "profile_id": existing["profile_id"],
+                    "profile_id": profile_id,
                     "path": str(path),
-                    "checksum": checksum,
+                    "checksum": duplicate_checksum,
                 }
 
-            parsed = json.loads(raw.decode("utf-8"))
+            parsed = _json_loads(raw)
             if not isinstance(parsed, dict):
                 raise ValueError("JSON root must be an object")
 
@@ -132,6 +392,7 @@ class IngestionWatcher:
             )
             if existing_by_id or existing_by_run:
                 duplicate = existing_by_id or existing_by_run
+                self._remember_checksum(checksum, duplicate["profile_id"], duplicate["checksum"])
                 self.repository.record_ingestion_file(
                     path=str(path),
                     checksum=duplicate["checksum"],
@@ -166,7 +427,7 @@ class IngestionWatcher:
                 "metadata": canonical_metadata,
                 "profile": profile_payload,
             }
-            artifact_bytes = json.dumps(envelope, indent=2, sort_keys=True).encode("utf-8")
+            artifact_bytes = _artifact_json_bytes(envelope)
             artifact_path = self.settings.profiles_dir / f"{profile_id}.json"
             artifact_path.write_bytes(artifact_bytes)
             artifact_checksum = _sha256(artifact_bytes)
@@ -182,6 +443,7 @@ class IngestionWatcher:
                 payload=profile_payload,
                 metadata=canonical_metadata,
             )
+            self._remember_checksum(checksum, profile_id, artifact_checksum)
             self.repository.record_ingestion_file(
                 path=str(path),
                 checksum=artifact_checksum,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import fields
+from datetime import datetime, timezone
 import hashlib
 import json
 from pathlib import Path
@@ -30,8 +31,6 @@ def _json_bytes(payload: dict[str, Any]) -> bytes:
 
 
 def _utc_now() -> str:
-    from datetime import datetime, timezone
-
     return datetime.now(tz=timezone.utc).isoformat()
 
 
@@ -188,7 +187,13 @@ class RunJobManager:
             def on_progress(event: dict[str, Any]) -> None:
                 self.repository.append_run_event(run_id, "progress", event)
 
-            report = engine.run(adapter, run_id=run_id, progress_callback=on_progress)
+            try:
+                report = engine.run(adapter, run_id=run_id, progress_callback=on_progress)
+            finally:
+                # Provider adapters hold an HTTP connection pool; simulated ones do not.
+                close = getattr(adapter, "close", None)
+                if close is not None:
+                    close()
             report_dict = report.to_dict()
 
             profile_id, artifact_path, checksum = self._persist_profile_artifact(
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 import json
 import sqlite3
 from pathlib import Path
 import threading
-from typing import Any
+from typing import Any, Callable
 
 
 def _utc_now() -> str:
-    from datetime import datetime, timezone
-
     return datetime.now(tz=timezone.utc).isoformat()
 
 
@@ -21,6 +20,8 @@ class ProfileStudioRepository:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self._lock = threading.Lock()
+        # Called with (profile_id, checksum) after record_profile writes a row.
+        self._profile_listeners: list[Callable[[str, str], None]] = []
         self._init_db()
         self._apply_migrations()
 
@@ -309,6 +310,12 @@ class ProfileStudioRepository:
                 """,
                 (profile_id, run_id, artifact_path, provider, source, checksum, _utc_now()),
             )
+        for listener in self._profile_listeners:
+            listener(profile_id, checksum)
+
+    def add_profile_listener(self, listener: Callable[[str, str], None]) -> None:
+        """Call ``listener(profile_id, checksum)`` whenever a profile row is written or replaced."""
+        self._profile_listeners.append(listener)
 
     def get_profile_by_checksum(self, checksum: str) -> dict[str, Any] | None:
         with self._connect() as conn:
@@ -330,6 +337,11 @@ class ProfileStudioRepository:
                 "metadata": json.loads(row["metadata_json"]),
             }
 
+    def list_profile_checksums(self) -> dict[str, str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT checksum, profile_id FROM profiles").fetchall()
+        return {row["checksum"]: row["profile_id"] for row in rows}
+
     def list_profiles(
         self,
         *,
@@ -58,7 +58,7 @@ def _enrich_record(record: dict[str, Any]) -> dict[str, Any]:
     if not row.get("trait_loadings"):
         row["trait_loadings"] = dict(item.trait_loadings)
     if not row.get("item_metadata"):
-        row["item_metadata"] = dict(item.metadata)
+        row["item_metadata"] = item.metadata_dict()
     if not row.get("family"):
         row["family"] = item.family
 
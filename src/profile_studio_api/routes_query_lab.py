@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 import time
@@ -14,7 +15,7 @@ from adaptive_profiler import AnthropicAdapter, OpenAIAdapter
 from adaptive_profiler.simulate import SimulatedModelAdapter, sample_true_thetas
 from adaptive_profiler.types import Item, RegimeConfig
 
-from .alignment_eval import evaluate_alignment
+from .alignment_eval import evaluate_alignment, evaluate_many
 from .deps import get_services
 from .interventions import (
     build_intervention_causal_trace,
@@ -123,7 +124,8 @@ def _invoke_chat(
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported provider '{provider}'")
 
-    out = adapter(query_text, regime, dummy_item)
+    with adapter:
+        out = adapter(query_text, regime, dummy_item)
     latency_ms = int((time.perf_counter() - t0) * 1000)
     return {
         "response_text": out.raw_text,
@@ -141,6 +143,7 @@ def apply_profile(request_body: QueryLabRequest, services: AppServices = Depends
         regime_id=request_body.regime_id,
         objective="safety_intent",
         disabled_rules=request_body.disabled_rules,
+        checksum=row["checksum"],
     )
 
     base_system = _base_system_prompt(request_body.regime_id)
@@ -243,6 +246,7 @@ def run_ab(request_body: QueryLabABRequest, services: AppServices = Depends(get_
         regime_id=request_body.regime_id,
         objective="safety_intent",
         disabled_rules=request_body.disabled_rules,
+        checksum=row["checksum"],
     )
 
     base_system = _base_system_prompt(request_body.regime_id)
@@ -321,19 +325,17 @@ def run_ab(request_body: QueryLabABRequest, services: AppServices = Depends(get_
         }
 
     evaluator_provider, evaluator_model_id = _resolve_evaluator_config(services, request_body.adapter_config)
-    baseline_alignment = evaluate_alignment(
-        query_text=request_body.query_text,
-        response_text=baseline["response_text"],
-        evaluator_provider=evaluator_provider,
-        evaluator_model_id=evaluator_model_id,
-        adapter_config=request_body.adapter_config,
-    )
-    treated_alignment = evaluate_alignment(
-        query_text=request_body.query_text,
-        response_text=treated["response_text"],
-        evaluator_provider=evaluator_provider,
-        evaluator_model_id=evaluator_model_id,
-        adapter_config=request_body.adapter_config,
+    # Sync routes run in the threadpool, so there is no running loop to collide with here.
+    baseline_alignment, treated_alignment = asyncio.run(
+        evaluate_many(
+            [
+                (request_body.query_text, baseline["response_text"]),
+                (request_body.query_text, treated["response_text"]),
+            ],
+            evaluator_provider=evaluator_provider,
+            evaluator_model_id=evaluator_model_id,
+            adapter_config=request_body.adapter_config,
+        )
     )
 
     baseline_rubric = {
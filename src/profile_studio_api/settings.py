@@ -17,6 +17,7 @@ class AppSettings:
     db_path: Path
     schema_path: Path
     ingestion_scan_interval_seconds: int = 10
+    ingestion_parallelism: int = 4
     explainability_v2_enabled: bool = True
     explainability_v3_enabled: bool = True
     evaluator_provider: str = "openai"
@@ -37,6 +38,7 @@ class AppSettings:
             )
         ).resolve()
         scan_interval = int(os.environ.get("LLMPSYCHO_INGESTION_SCAN_SECONDS", "10"))
+        ingestion_parallelism = int(os.environ.get("LLMPSYCHO_INGESTION_PARALLELISM", "4"))
         explainability_v2_enabled = os.environ.get("LLMPSYCHO_EXPLAINABILITY_V2", "1").strip().lower() not in {
             "0",
             "false",
@@ -60,6 +62,7 @@ class AppSettings:
             db_path=db_path,
             schema_path=schema_path,
             ingestion_scan_interval_seconds=max(1, scan_interval),
+            ingestion_parallelism=max(1, ingestion_parallelism),
             explainability_v2_enabled=explainability_v2_enabled,
             explainability_v3_enabled=explainability_v3_enabled,
             evaluator_provider=evaluator_provider,
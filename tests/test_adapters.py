@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+import unittest
+
+from adaptive_profiler.adapters import AnthropicAdapter, OpenAIAdapter
+from adaptive_profiler.types import Item, RegimeConfig
+
+
+def _item() -> Item:
+    return Item(
+        item_id="A01",
+        family="deterministic_qa_math_logic",
+        prompt="Return only integer: 2+2",
+        scoring_type="exact_text",
+        trait_loadings={"T1": 1.0},
+        metadata={"expected": "4"},
+    )
+
+
+def _openai_response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+        usage=SimpleNamespace(prompt_tokens=11, completion_tokens=2),
+    )
+
+
+def _anthropic_response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=13, output_tokens=3),
+    )
+
+
+class _FakeCompletions:
+    def __init__(self, response: SimpleNamespace) -> None:
+        self.response = response
+        self.calls: list[dict] = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0)
+        return self.response
+
+
+class OpenAIAdapterTest(unittest.TestCase):
+    def test_sync_and_async_paths_send_same_request(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test", max_tokens=16)
+        sync_completions = _FakeCompletions(_openai_response("4"))
+        async_completions = _FakeAsyncCompletions(_openai_response("4"))
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=sync_completions))
+        adapter._aclient = SimpleNamespace(chat=SimpleNamespace(completions=async_completions))
+        regime = RegimeConfig(regime_id="core", system_prompt="Be terse.", temperature=0.0)
+
+        sync_out = adapter("2+2?", regime, _item())
+        async_out = asyncio.run(adapter.acall("2+2?", regime, _item()))
+
+        self.assertEqual(sync_out, async_out)
+        self.assertEqual(async_out.raw_text, "4")
+        self.assertEqual((async_out.prompt_tokens, async_out.completion_tokens), (11, 2))
+        self.assertEqual(sync_completions.calls, async_completions.calls)
+        self.assertEqual(async_completions.calls[0]["messages"][0]["role"], "system")
+
+    def test_system_message_is_built_once_per_regime(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test")
+        completions = _FakeCompletions(_openai_response("ok"))
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        first = RegimeConfig(regime_id="eval", system_prompt="  Judge strictly. ")
+        reused_id = RegimeConfig(regime_id="eval", system_prompt="Judge leniently.")
+
+        adapter("a", first, _item())
+        adapter("b", first, _item())
+        adapter("c", reused_id, _item())
+        adapter("d", RegimeConfig(regime_id="core"), _item())
+
+        system_a, user_a = completions.calls[0]["messages"]
+        system_b, user_b = completions.calls[1]["messages"]
+        self.assertIs(system_a, system_b)
+        self.assertEqual(system_a["content"], "Judge strictly.")
+        self.assertEqual((user_a["content"], user_b["content"]), ("a", "b"))
+        self.assertEqual(completions.calls[2]["messages"][0]["content"], "Judge leniently.")
+        self.assertEqual([m["role"] for m in completions.calls[3]["messages"]], ["user"])
+
+    def test_regimes_sharing_a_prompt_share_system_messages(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test")
+        completions = _FakeCompletions(_openai_response("ok"))
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        core = RegimeConfig(regime_id="core", system_prompt="Be terse.", temperature=0.2)
+        strict = RegimeConfig(regime_id="strict", system_prompt="Be terse.", temperature=0.0)
+
+        adapter("a", core, _item())
+        adapter("b", strict, _item())
+
+        self.assertEqual(core.prompt_key, strict.prompt_key)
+        self.assertNotEqual(core.prompt_key, RegimeConfig(regime_id="core").prompt_key)
+        self.assertIs(completions.calls[0]["messages"][0], completions.calls[1]["messages"][0])
+
+
+class ResultCacheTest(unittest.TestCase):
+    def test_deterministic_regime_results_are_reused_when_enabled(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test", cache_deterministic=True)
+        completions = _FakeCompletions(_openai_response("4"))
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        adapter("2+2?", RegimeConfig(regime_id="eval", temperature=0.0), _item())
+        adapter("2+2?", RegimeConfig(regime_id="eval", temperature=0.0), _item())
+        adapter("2+2?", RegimeConfig(regime_id="core", temperature=0.2), _item())
+        adapter("2+2?", RegimeConfig(regime_id="core", temperature=0.2), _item())
+
+        self.assertEqual(len(completions.calls), 3)
+
+    def test_cache_is_off_by_default(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test")
+        completions = _FakeCompletions(_openai_response("4"))
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        adapter("2+2?", RegimeConfig(regime_id="eval", temperature=0.0), _item())
+        adapter("2+2?", RegimeConfig(regime_id="eval", temperature=0.0), _item())
+
+        self.assertEqual(len(completions.calls), 2)
+
+
+class _FlakyCompletions(_FakeCompletions):
+    def __init__(self, response: SimpleNamespace, failures: int) -> None:
+        super().__init__(response)
+        self.failures = failures
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("transient")
+        return self.response
+
+
+class RetryTest(unittest.TestCase):
+    def _adapter(self, completions: _FakeCompletions, max_retries: int) -> OpenAIAdapter:
+        adapter = OpenAIAdapter(
+            model="gpt-test",
+            api_key="sk-test",
+            max_retries=max_retries,
+            retry_initial_seconds=0.0,
+        )
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        adapter._retryable_errors = lambda: (ConnectionError,)
+        return adapter
+
+    def test_transient_errors_are_retried(self) -> None:
+        completions = _FlakyCompletions(_openai_response("4"), failures=2)
+        out = self._adapter(completions, max_retries=4)("q", RegimeConfig(regime_id="core"), _item())
+        self.assertEqual(out.raw_text, "4")
+        self.assertEqual(len(completions.calls), 3)
+
+    def test_gives_up_after_max_retries(self) -> None:
+        completions = _FlakyCompletions(_openai_response("4"), failures=10)
+        adapter = self._adapter(completions, max_retries=2)
+        with self.assertRaises(ConnectionError):
+            adapter("q", RegimeConfig(regime_id="core"), _item())
+        self.assertEqual(len(completions.calls), 3)
+
+    def test_non_retryable_errors_propagate_immediately(self) -> None:
+        completions = _FlakyCompletions(_openai_response("4"), failures=1)
+        adapter = self._adapter(completions, max_retries=4)
+        adapter._retryable_errors = lambda: ()
+        with self.assertRaises(ConnectionError):
+            adapter("q", RegimeConfig(regime_id="core"), _item())
+        self.assertEqual(len(completions.calls), 1)
+
+
+class _TrackingAsyncCompletions:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return _openai_response(kwargs["messages"][-1]["content"])
+
+
+class AsyncDispatchTest(unittest.TestCase):
+    def test_acall_many_caps_in_flight_requests_and_keeps_order(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test", max_concurrency=3)
+        tracker = _TrackingAsyncCompletions()
+        adapter._aclient = SimpleNamespace(chat=SimpleNamespace(completions=tracker))
+        regime = RegimeConfig(regime_id="core")
+        triples = [(f"q{i}", regime, _item()) for i in range(10)]
+
+        outputs = asyncio.run(adapter.acall_many(triples))
+
+        self.assertEqual([o.raw_text for o in outputs], [f"q{i}" for i in range(10)])
+        self.assertEqual(tracker.peak, 3)
+
+    def test_identical_concurrent_calls_share_one_request(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test")
+        tracker = _TrackingAsyncCompletions()
+        calls: list[dict] = []
+        original_create = tracker.create
+
+        async def counting_create(**kwargs):
+            calls.append(kwargs)
+            return await original_create(**kwargs)
+
+        tracker.create = counting_create
+        adapter._aclient = SimpleNamespace(chat=SimpleNamespace(completions=tracker))
+        regime = RegimeConfig(regime_id="core")
+
+        outputs = asyncio.run(adapter.acall_many([("same", regime, _item())] * 4 + [("other", regime, _item())]))
+
+        self.assertEqual([o.raw_text for o in outputs], ["same"] * 4 + ["other"])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(adapter._inflight, {})
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with self.assertRaises(ValueError):
+            OpenAIAdapter(model="gpt-test", api_key="sk-test", max_concurrency=0)
+
+
+class _FakeStream:
+    def __init__(self, deltas: list[str]) -> None:
+        self.deltas = deltas
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for delta in self.deltas:
+            self.consumed += 1
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))],
+                usage=None,
+            )
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(prompt_tokens=9, completion_tokens=4))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeStreamingCompletions:
+    def __init__(self, stream: _FakeStream) -> None:
+        self.stream = stream
+
+    def create(self, **kwargs):
+        assert kwargs["stream"] is True
+        return self.stream
+
+
+class StreamingTest(unittest.TestCase):
+    def test_full_stream_uses_reported_usage(self) -> None:
+        adapter = OpenAIAdapter(model="gpt-test", api_key="sk-test", use_streaming=True)
+        stream = _FakeStream(["{\"c\"", ": true", "}"])
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeStreamingCompletions(stream)))
+
+        out = adapter("q", RegimeConfig(regime_id="core"), _item())
+
+        self.assertEqual(out.raw_text, '{"c": true}')
+        self.assertEqual((out.prompt_tokens, out.completion_tokens), (9, 4))
+        self.assertTrue(stream.closed)
+
+    def test_stop_predicate_abandons_stream_early(self) -> None:
+        adapter = OpenAIAdapter(
+            model="gpt-test",
+            api_key="sk-test",
+            use_streaming=True,
+            stop_predicate=lambda text: text.strip().isdigit(),
+        )
+        stream = _FakeStream(["4", "\n\nExplanation", " follows."])
+        adapter._client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeStreamingCompletions(stream)))
+
+        out = adapter("q", RegimeConfig(regime_id="core"), _item())
+
+        self.assertEqual(out.raw_text, "4")
+        self.assertEqual(stream.consumed, 1)
+        self.assertTrue(stream.closed)
+        self.assertGreater(out.prompt_tokens, 0)
+
+
+class _Closable:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _AsyncClosable:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class LifecycleTest(unittest.TestCase):
+    def test_context_manager_closes_sync_client(self) -> None:
+        client = _Closable()
+        with OpenAIAdapter(model="gpt-test", api_key="sk-test") as adapter:
+            adapter._client = client
+        self.assertTrue(client.closed)
+        self.assertIsNone(adapter._client)
+        adapter.close()
+
+    def test_async_context_manager_closes_both_clients(self) -> None:
+        client = _Closable()
+        aclient = _AsyncClosable()
+
+        async def scenario() -> AnthropicAdapter:
+            async with AnthropicAdapter(model="claude-test", api_key="sk-ant-test") as adapter:
+                adapter._client = client
+                adapter._aclient = aclient
+            return adapter
+
+        adapter = asyncio.run(scenario())
+        self.assertTrue(client.closed)
+        self.assertTrue(aclient.closed)
+        self.assertIsNone(adapter._aclient)
+
+
+class AnthropicAdapterTest(unittest.TestCase):
+    def test_async_path_joins_text_blocks(self) -> None:
+        adapter = AnthropicAdapter(model="claude-test", api_key="sk-ant-test", max_tokens=16)
+        async_messages = _FakeAsyncCompletions(_anthropic_response("4"))
+        adapter._aclient = SimpleNamespace(messages=async_messages)
+        regime = RegimeConfig(regime_id="core", system_prompt="Be terse.", temperature=0.0)
+
+        out = asyncio.run(adapter.acall("2+2?", regime, _item()))
+
+        self.assertEqual(out.raw_text, "4")
+        self.assertEqual((out.prompt_tokens, out.completion_tokens), (13, 3))
+        self.assertEqual(async_messages.calls[0]["system"][0]["text"], "Be terse.")
+
+    def test_system_prompt_is_cacheable_and_cache_reads_are_reported(self) -> None:
+        adapter = AnthropicAdapter(model="claude-test", api_key="sk-ant-test")
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            usage=SimpleNamespace(
+                input_tokens=5,
+                output_tokens=1,
+                cache_read_input_tokens=40,
+                cache_creation_input_tokens=0,
+            ),
+        )
+        messages = _FakeCompletions(response)
+        adapter._client = SimpleNamespace(messages=messages)
+
+        out = adapter("q", RegimeConfig(regime_id="safety", system_prompt="Be safe."), _item())
+        adapter("q", RegimeConfig(regime_id="core", system_prompt=""), _item())
+
+        system_blocks = messages.calls[0]["system"]
+        self.assertEqual(system_blocks[0]["cache_control"], {"type": "ephemeral"})
+        self.assertNotIn("system", messages.calls[1])
+        self.assertEqual((out.prompt_tokens, out.cached_prompt_tokens), (45, 40))
+
+
+
+class _FakeAnthropicBatches:
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+        self.retrievals = 0
+
+    def create(self, *, requests):
+        self.requests = list(requests)
+        return SimpleNamespace(id="batch-1")
+
+    def retrieve(self, batch_id: str):
+        self.retrievals += 1
+        status = "ended" if self.retrievals >= 2 else "in_progress"
+        return SimpleNamespace(id=batch_id, processing_status=status)
+
+    def results(self, batch_id: str):
+        first, second = self.requests
+        yield SimpleNamespace(
+            custom_id=first["custom_id"],
+            result=SimpleNamespace(type="succeeded", message=_anthropic_response("ok")),
+        )
+        yield SimpleNamespace(custom_id=second["custom_id"], result=SimpleNamespace(type="errored"))
+
+
+class BatchTest(unittest.TestCase):
+    def test_anthropic_batch_round_trip(self) -> None:
+        adapter = AnthropicAdapter(model="claude-test", api_key="sk-ant-test")
+        batches = _FakeAnthropicBatches()
+        adapter._client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        core = RegimeConfig(regime_id="core")
+        safety = RegimeConfig(regime_id="safety", system_prompt="Be safe.")
+
+        batch_id = adapter.submit_batch([("q", core, _item()), ("q", safety, _item())])
+        results = adapter.wait_batch(batch_id, interval_seconds=0.0)
+
+        self.assertEqual(batch_id, "batch-1")
+        self.assertEqual(batches.retrievals, 2)
+        self.assertEqual(list(results), [adapter.batch_custom_id(core, _item())])
+        self.assertEqual(results["core-A01"].raw_text, "ok")
+        self.assertEqual(batches.requests[1]["params"]["system"][0]["text"], "Be safe.")
+
+    def test_duplicate_batch_entries_are_rejected(self) -> None:
+        adapter = AnthropicAdapter(model="claude-test", api_key="sk-ant-test")
+        core = RegimeConfig(regime_id="core")
+        with self.assertRaises(ValueError):
+            adapter.submit_batch([("q", core, _item()), ("q", core, _item())])
+
+
+if __name__ == "__main__":
+    unittest.main()
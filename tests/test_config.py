@@ -20,5 +20,27 @@ class RunConfigDefaultsTest(unittest.TestCase):
         self.assertEqual(cfg.reliability_target, 0.85)
 
 
+class RunConfigReplaceTest(unittest.TestCase):
+    def test_replace_applies_overrides_and_matches_constructor(self) -> None:
+        base = RunConfig(model_id="m")
+        swept = base.replace(call_cap=80, exploration_start=0.3)
+        self.assertEqual(swept, RunConfig(model_id="m", call_cap=80, exploration_start=0.3))
+        self.assertEqual(base.call_cap, 60)
+        self.assertIs(swept.regimes, base.regimes)
+
+    def test_replace_revalidates_affected_constraints(self) -> None:
+        base = RunConfig()
+        with self.assertRaisesRegex(ValueError, "min_calls_before_global_stop"):
+            base.replace(call_cap=30)
+        with self.assertRaisesRegex(ValueError, "minimum stage totals"):
+            base.replace(stage_a_min=20, stage_b_min=25, min_calls_before_global_stop=10, call_cap=50)
+        with self.assertRaisesRegex(ValueError, "exploration bounds"):
+            base.replace(exploration_end=0.5)
+        with self.assertRaisesRegex(ValueError, "exploration_policy"):
+            base.replace(exploration_policy="softmax")
+        with self.assertRaises(TypeError):
+            base.replace(call_limit=10)
+
+
 if __name__ == "__main__":
     unittest.main()
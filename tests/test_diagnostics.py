@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import unittest
+
+from adaptive_profiler.diagnostics import (
+    benchmark_training_index,
+    estimate_ood_gap,
+    paraphrase_consistency,
+    summary_call_stats,
+)
+from adaptive_profiler.types import ResponseRecord, ResponseRecordBatch
+
+
+def _record(item_id: str, score: float, expected: float = 0.5, latency_ms: int = 100) -> ResponseRecord:
+    return ResponseRecord(
+        run_id="diag-run",
+        call_index=0,
+        stage="A",
+        regime_id="core",
+        item_id=item_id,
+        family="paraphrase_twins_triplets",
+        prompt_tokens=90,
+        completion_tokens=8,
+        latency_ms=latency_ms,
+        expected_probability=expected,
+        score=score,
+        score_components={"override": score},
+    )
+
+
+class DiagnosticsTest(unittest.TestCase):
+    def test_paraphrase_consistency_averages_group_spread(self) -> None:
+        records = [
+            _record("a1", 1.0),
+            _record("a2", 0.0),
+            _record("a3", 0.5),
+            _record("b1", 0.75),
+            _record("b2", 0.25),
+            _record("c1", 0.0),
+            _record("x", 0.0),
+        ]
+        groups = {"a1": "a", "a2": "a", "a3": "a", "b1": "b", "b2": "b", "c1": "c", "x": None}
+        # Spreads: a=1.0, b=0.5; singleton group c is ignored.
+        self.assertAlmostEqual(paraphrase_consistency(records, groups), 0.25)
+
+    def test_paraphrase_consistency_defaults_to_one_without_pairs(self) -> None:
+        self.assertEqual(paraphrase_consistency([_record("a1", 0.0)], {"a1": "a"}), 1.0)
+        self.assertEqual(paraphrase_consistency([], {}), 1.0)
+
+    def test_bti_and_ood_gap_partition_scores(self) -> None:
+        records = [
+            _record("in1", 1.0, expected=0.8),
+            _record("in2", 0.0, expected=0.4),
+            _record("ood", 0.0, expected=0.5),
+            _record("sent", 1.0, expected=0.5),
+        ]
+        ood = {"ood": True}
+        sentinel = {"sent": True}
+
+        _, components = benchmark_training_index(records, item_is_ood=ood, item_is_sentinel=sentinel)
+
+        self.assertAlmostEqual(components["in_bank_mean"], 0.5)
+        self.assertAlmostEqual(components["ood_mean"], 0.0)
+        self.assertAlmostEqual(components["person_fit_anomaly"], (0.2 + 0.4 + 0.5 + 0.5) / 4)
+        # Sentinels count toward the in-bank side of the OOD gap.
+        self.assertAlmostEqual(estimate_ood_gap(records, ood), 2.0 / 3.0)
+
+    def test_summary_call_stats_totals_and_median_latency(self) -> None:
+        records = [_record(f"i{n}", 1.0, latency_ms=ms) for n, ms in enumerate((40, 10, 30, 20))]
+        stats = summary_call_stats(records)
+        self.assertEqual(stats["calls"], 4)
+        self.assertEqual(stats["prompt_tokens"], 360.0)
+        self.assertEqual(stats["completion_tokens"], 32.0)
+        self.assertEqual(stats["latency_ms_p50"], 25.0)
+        self.assertEqual(summary_call_stats([])["latency_ms_p50"], 0.0)
+
+    def test_columnar_batch_matches_record_list(self) -> None:
+        records = [
+            _record("a1", 1.0, expected=0.7, latency_ms=12),
+            _record("a2", 0.0, expected=0.2, latency_ms=30),
+            _record("ood", 0.5, expected=0.6, latency_ms=18),
+        ]
+        batch = ResponseRecordBatch.from_records(records)
+        groups = {"a1": "a", "a2": "a"}
+        ood = {"ood": True}
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(paraphrase_consistency(batch, groups), paraphrase_consistency(records, groups))
+        self.assertEqual(
+            benchmark_training_index(batch, ood, {}),
+            benchmark_training_index(records, ood, {}),
+        )
+        self.assertEqual(estimate_ood_gap(batch, ood), estimate_ood_gap(records, ood))
+        self.assertEqual(summary_call_stats(batch), summary_call_stats(records))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import dataclasses
+from functools import partial
+import pickle
 import unittest
 
+from adaptive_profiler import _mirt_numba
 from adaptive_profiler.config import RunConfig
-from adaptive_profiler.engine import AdaptiveProfilerEngine
-from adaptive_profiler.item_bank import build_item_bank
-from adaptive_profiler.simulate import SimulatedModelAdapter, sample_true_thetas
+from adaptive_profiler.engine import AdaptiveProfilerEngine, _preview
+from adaptive_profiler.item_bank import build_item_bank, build_item_bank_arrays
+from adaptive_profiler.mirt import DiagonalMIRT
+from adaptive_profiler.simulate import SimulatedModelAdapter, run_panel, sample_true_thetas
+from adaptive_profiler.traits import TRAIT_CODES
+from adaptive_profiler.types import ITEM_SENTINEL_MASK, PosteriorState
 
 
 class EngineBasicBehaviorTest(unittest.TestCase):
@@ -25,6 +32,34 @@ class EngineBasicBehaviorTest(unittest.TestCase):
         self.assertGreaterEqual(int(report.diagnostics["calls_in_stage_b"]), cfg.stage_b_min)
         self.assertGreaterEqual(int(report.diagnostics["calls_in_stage_c"]), cfg.stage_c_min)
 
+    def test_run_accepts_banks_with_many_regime_tags(self) -> None:
+        cfg = RunConfig(model_id="many-regimes-test")
+        base = build_item_bank(seed=17)
+        extra = [
+            dataclasses.replace(item, item_id=f"X{n}", regime_tags=(*item.regime_tags, f"extra-{n}"))
+            for n, item in enumerate(base[:20])
+        ]
+        bank = base + extra
+        engine = AdaptiveProfilerEngine(config=cfg, item_bank=bank, seed=77)
+        adapter = SimulatedModelAdapter(true_theta_by_regime=sample_true_thetas(seed=88), seed=89)
+
+        report = engine.run(adapter, run_id="many-regimes-run")
+
+        self.assertGreater(len(build_item_bank_arrays(bank).regime_ids), 16)
+        self.assertGreater(len(report.records), 0)
+        self.assertEqual(build_item_bank_arrays(bank).regime_rows("extra-19"), [len(bank) - 1])
+
+    def test_two_choice_exploration_runs_within_guards(self) -> None:
+        cfg = RunConfig(model_id="two-choice-test", exploration_policy="two_choice")
+        engine = AdaptiveProfilerEngine(config=cfg, item_bank=build_item_bank(seed=17), seed=77)
+        adapter = SimulatedModelAdapter(true_theta_by_regime=sample_true_thetas(seed=88), seed=89)
+
+        report = engine.run(adapter, run_id="two-choice-run")
+
+        self.assertLessEqual(report.budget.calls_used, cfg.call_cap)
+        self.assertEqual(len({r.item_id for r in report.records}), len(report.records))
+        self.assertGreaterEqual(int(report.diagnostics["sentinel_items_sampled"]), cfg.sentinel_minimum)
+
     def test_records_include_enriched_trace_fields(self) -> None:
         cfg = RunConfig(model_id="trace-test")
         engine = AdaptiveProfilerEngine(config=cfg, item_bank=build_item_bank(seed=17), seed=44)
@@ -42,6 +77,205 @@ class EngineBasicBehaviorTest(unittest.TestCase):
         self.assertIsNotNone(first.posterior_after)
         self.assertIsNotNone(first.selection_context)
 
+    def test_progress_callback_is_optional_and_matches_records(self) -> None:
+        cfg = RunConfig(model_id="progress-test")
+
+        def _run(callback=None):
+            engine = AdaptiveProfilerEngine(config=cfg, item_bank=build_item_bank(seed=17), seed=51)
+            adapter = SimulatedModelAdapter(true_theta_by_regime=sample_true_thetas(seed=52), seed=53)
+            return engine.run(adapter, run_id="progress-run", progress_callback=callback)
+
+        events: list[dict] = []
+        with_callback = _run(events.append)
+        without_callback = _run()
+
+        self.assertEqual(len(events), len(with_callback.records))
+        self.assertEqual(
+            [r.item_id for r in with_callback.records],
+            [r.item_id for r in without_callback.records],
+        )
+        first, record = events[0], with_callback.records[0]
+        self.assertEqual(first["item_id"], record.item_id)
+        self.assertEqual(set(first["critical_delta_preview"]), set(cfg.critical_traits))
+        self.assertLessEqual(len(first["response_preview"]), 180)
+
+    def test_preview_matches_full_whitespace_collapse(self) -> None:
+        def reference(text: str, limit: int = 180) -> str:
+            compact = " ".join(text.split())
+            return compact if len(compact) <= limit else compact[: limit - 3] + "..."
+
+        samples = [
+            "",
+            "short answer",
+            "  padded\n\tanswer  ",
+            "word " * 500,
+            " " * 2000 + "tail after a long blank run",
+            "x" * 179 + " " * 600 + "y",
+            "a\n" * 90 + "b",
+        ]
+        for text in samples:
+            self.assertEqual(_preview(text), reference(text))
+
+    def test_run_batch_matches_sequential_runs(self) -> None:
+        cfg = RunConfig(model_id="batch-test")
+        bank = build_item_bank(seed=17)
+        factories = [
+            partial(SimulatedModelAdapter, true_theta_by_regime=sample_true_thetas(seed=60 + n), seed=70 + n)
+            for n in range(2)
+        ]
+
+        reports = AdaptiveProfilerEngine(config=cfg, item_bank=bank, seed=5).run_batch(
+            factories, run_ids=["b0", "b1"], max_workers=2
+        )
+
+        self.assertEqual([r.run_id for r in reports], ["b0", "b1"])
+        for index, (factory, report) in enumerate(zip(factories, reports)):
+            expected = AdaptiveProfilerEngine(config=cfg, item_bank=bank, seed=5 + index).run(factory(), run_id="seq")
+            self.assertEqual([r.item_id for r in report.records], [r.item_id for r in expected.records])
+            self.assertEqual(report.diagnostics, expected.diagnostics)
+
+    def test_run_panel_is_independent_of_worker_count(self) -> None:
+        parallel = run_panel(runs=2, seed=300, max_workers=2)
+        sequential = run_panel(runs=2, seed=300, max_workers=1)
+
+        self.assertEqual([r.run_id for r in parallel], ["sim-000", "sim-001"])
+        for got, want in zip(parallel, sequential):
+            self.assertEqual([r.item_id for r in got.records], [r.item_id for r in want.records])
+            self.assertEqual(got.diagnostics, want.diagnostics)
+
+    def test_default_item_bank_is_built_once_and_shared(self) -> None:
+        first = AdaptiveProfilerEngine()
+        second = AdaptiveProfilerEngine()
+
+        self.assertIsNot(first.item_bank, second.item_bank)
+        self.assertIs(first.item_bank[0], second.item_bank[0])
+        self.assertEqual(first.item_bank, build_item_bank(seed=17))
+        self.assertIsNot(build_item_bank(seed=17), build_item_bank(seed=17))
+        self.assertEqual(len(build_item_bank(seed=17)), 265)
+        self.assertIs(build_item_bank_arrays(first.item_bank), build_item_bank_arrays())
+        self.assertIsNot(build_item_bank_arrays(first.item_bank[1:]), build_item_bank_arrays())
+
+    def test_shared_bank_items_have_read_only_metadata(self) -> None:
+        item = next(item for item in build_item_bank(seed=17) if "keywords" in item.metadata)
+
+        with self.assertRaises(TypeError):
+            item.metadata["keywords"] = []
+        with self.assertRaises(TypeError):
+            item.metadata.update(extra=1)
+        self.assertIsInstance(item.metadata["keywords"], tuple)
+
+        copy = item.metadata_dict()
+        copy["keywords"].append("extra")
+        self.assertNotIn("extra", item.metadata["keywords"])
+        self.assertEqual(pickle.loads(pickle.dumps(item)), item)
+
+
+class PosteriorStateTest(unittest.TestCase):
+    def test_vector_accessors_match_scalar_accessors(self) -> None:
+        posterior = PosteriorState.prior(prior_variance=1.5)
+        for index, trait in enumerate(TRAIT_CODES):
+            posterior.mean[trait] = 0.3 * index - 1.0
+            posterior.variance[trait] = 0.05 * (index + 1)
+        posterior.variance["T12"] = 2.0
+
+        self.assertEqual(
+            posterior.reliability_vec(TRAIT_CODES),
+            [posterior.reliability(trait) for trait in TRAIT_CODES],
+        )
+        self.assertEqual(
+            posterior.ci95_width_vec(TRAIT_CODES),
+            [posterior.ci95_width(trait) for trait in TRAIT_CODES],
+        )
+        self.assertEqual(posterior.reliability_vec(), posterior.reliability_vec(TRAIT_CODES))
+        self.assertEqual(posterior.ci95_width_vec(), posterior.ci95_width_vec(TRAIT_CODES))
+        self.assertEqual(posterior.mean_vec(("T2", "X1")), [posterior.mean["T2"], 0.0])
+        self.assertEqual(posterior.variance_vec(("T12", "X1")), [2.0, 1.0])
+
+    def test_update_returns_new_state_without_mutating_input(self) -> None:
+        before = PosteriorState.prior()
+        item = build_item_bank(seed=17)[0]
+
+        after = DiagonalMIRT().update(before, item=item, score=1.0)
+
+        self.assertIsNot(after, before)
+        self.assertEqual(before, PosteriorState.prior())
+        self.assertNotEqual(after.mean, before.mean)
+
+    def test_update_inplace_matches_update_and_journals_prior_values(self) -> None:
+        item = build_item_bank(seed=17)[0]
+        mirt = DiagonalMIRT()
+        expected = mirt.update(PosteriorState.prior(), item=item, score=0.0)
+
+        state = PosteriorState.prior()
+        journal = mirt.update_inplace(state, item=item, score=0.0)
+
+        self.assertEqual(state, expected)
+        self.assertEqual(set(journal), set(item.trait_loadings))
+        self.assertEqual(journal[next(iter(item.trait_loadings))], (0.0, 1.0))
+
+
+class BankArraysTest(unittest.TestCase):
+    def test_bank_wide_scoring_matches_per_item_scoring(self) -> None:
+        items = build_item_bank(seed=17)
+        bank = build_item_bank_arrays(items)
+        mirt = DiagonalMIRT()
+        posterior = PosteriorState.prior()
+        for index, trait in enumerate(TRAIT_CODES):
+            posterior.mean[trait] = 0.1 * index - 0.4
+            posterior.variance[trait] = 0.2 + 0.05 * index
+
+        self.assertEqual(len(bank), len(items))
+        self.assertEqual(
+            mirt.expected_probability_all(bank, posterior),
+            [mirt.expected_probability(item, posterior) for item in items],
+        )
+        rows = [3, 40, 7]
+        self.assertEqual(
+            mirt.expected_information_gain_all(bank, posterior, rows),
+            [mirt.expected_information_gain(items[row], posterior) for row in rows],
+        )
+        self.assertEqual(
+            mirt.score_rows(bank, posterior, range(len(items))),
+            (
+                [mirt.expected_probability(item, posterior) for item in items],
+                [mirt.expected_information_gain(item, posterior) for item in items],
+            ),
+        )
+
+    def test_flag_and_regime_columns_match_items(self) -> None:
+        items = build_item_bank(seed=17)
+        bank = build_item_bank_arrays(items)
+
+        self.assertEqual(
+            [bool(flags & ITEM_SENTINEL_MASK) for flags in bank.flags],
+            [item.counts_as_sentinel for item in items],
+        )
+        for regime_id in ("core", "safety"):
+            self.assertEqual(
+                bank.regime_rows(regime_id),
+                [row for row, item in enumerate(items) if regime_id in item.regime_tags],
+            )
+        self.assertEqual(bank.regime_rows("missing"), [])
+
+    def test_numba_kernel_matches_python_scoring(self) -> None:
+        if not _mirt_numba.AVAILABLE:
+            with self.assertRaises(ImportError):
+                DiagonalMIRT(use_numba=True)
+            self.skipTest("numba not installed")
+        items = build_item_bank(seed=17)
+        bank = build_item_bank_arrays(items)
+        posterior = PosteriorState.prior()
+        posterior.mean["T3"] = 0.6
+        posterior.variance["T8"] = 0.3
+        rows = range(0, len(items), 3)
+
+        expected = DiagonalMIRT().score_rows(bank, posterior, rows)
+        actual = DiagonalMIRT(use_numba=True).score_rows(bank, posterior, rows)
+
+        for want, got in zip(expected, actual):
+            for a, b in zip(want, got):
+                self.assertAlmostEqual(a, b, places=12)
+
 
 if __name__ == "__main__":
     unittest.main()
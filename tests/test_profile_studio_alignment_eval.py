@@ -1,8 +1,58 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import unittest
+from unittest import mock
 
-from profile_studio_api.alignment_eval import evaluate_alignment
+import adaptive_profiler
+from adaptive_profiler.types import ModelOutput
+from profile_studio_api.alignment_eval import _extract_json, evaluate_alignment, evaluate_many
+
+
+class _CountingJudge:
+    calls = 0
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    def __enter__(self) -> "_CountingJudge":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def __call__(self, prompt, regime, item) -> ModelOutput:
+        type(self).calls += 1
+        payload = {"intent_fidelity": 0.9, "confidence": 0.8, "rationale": {"intent_fidelity": "on target"}}
+        return ModelOutput(raw_text=json.dumps(payload), prompt_tokens=10, completion_tokens=10)
+
+
+class _AsyncJudge:
+    calls = 0
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    async def __aenter__(self) -> "_AsyncJudge":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def acall(self, prompt, regime, item) -> ModelOutput:
+        cls = type(self)
+        cls.calls += 1
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        if "explode" in prompt:
+            raise RuntimeError("provider down")
+        payload = {"intent_fidelity": 0.7, "confidence": 0.9, "rationale": "async verdict"}
+        return ModelOutput(raw_text=json.dumps(payload), prompt_tokens=10, completion_tokens=10)
 
 
 class AlignmentEvalTest(unittest.TestCase):
@@ -21,6 +71,53 @@ class AlignmentEvalTest(unittest.TestCase):
         self.assertGreaterEqual(result.alignment_report["confidence"], 0.0)
         self.assertLessEqual(result.alignment_report["confidence"], 1.0)
 
+    def test_repeat_evaluation_reuses_judge_verdict_and_scores(self) -> None:
+        _CountingJudge.calls = 0
+        kwargs = {
+            "query_text": "Summarise the cache policy in one line.",
+            "response_text": "Temperature-0 verdicts are cached per query/response pair.",
+            "evaluator_provider": "openai",
+            "evaluator_model_id": "judge-cache-test",
+        }
+        with mock.patch.object(adaptive_profiler, "OpenAIAdapter", _CountingJudge):
+            first = evaluate_alignment(**kwargs)
+            first.trace["judge_payload"]["rationale"]["intent_fidelity"] = "mutated by caller"
+            second = evaluate_alignment(**kwargs)
+            evaluate_alignment(**{**kwargs, "evaluator_model_id": "other-judge"})
+
+        self.assertEqual(_CountingJudge.calls, 2)
+        self.assertEqual(second.alignment_report["mode"], "hybrid")
+        self.assertEqual(second.trace["judge_payload"]["rationale"]["intent_fidelity"], "on target")
+        self.assertEqual(second.trace["deterministic_scores"], first.trace["deterministic_scores"])
+        self.assertIsNot(second.trace["deterministic_scores"], first.trace["deterministic_scores"])
+
+    def test_extract_json_handles_wrapped_and_trailing_text(self) -> None:
+        self.assertEqual(_extract_json(' {"a": 1} '), {"a": 1})
+        self.assertEqual(_extract_json('Verdict: {"a": {"b": "}"}} -- see {notes}'), {"a": {"b": "}"}})
+        self.assertIsNone(_extract_json("[1, 2]"))
+        self.assertIsNone(_extract_json("no json {here"))
+        self.assertIsNone(_extract_json("   "))
+
+    def test_evaluate_many_overlaps_calls_and_keeps_order(self) -> None:
+        _AsyncJudge.calls = _AsyncJudge.peak = 0
+        pairs = [
+            ("Name a prime number.", "Seven is prime."),
+            ("Name an even prime.", "Two."),
+            ("Please explode.", "No."),
+        ]
+        kwargs = {"evaluator_provider": "openai", "evaluator_model_id": "async-judge-test"}
+        with mock.patch.object(adaptive_profiler, "OpenAIAdapter", _AsyncJudge):
+            results = asyncio.run(evaluate_many(pairs, **kwargs))
+            again = asyncio.run(evaluate_many(pairs[:2], **kwargs))
+
+        self.assertEqual([r.trace["query_text"] for r in results], [q for q, _ in pairs])
+        self.assertEqual([r.alignment_report["mode"] for r in results], ["hybrid", "hybrid", "deterministic_only"])
+        self.assertIn("provider down", results[2].trace["judge_error"])
+        self.assertEqual(_AsyncJudge.peak, 3)
+        # Successful verdicts are served from the cache on the second batch.
+        self.assertEqual(_AsyncJudge.calls, 3)
+        self.assertEqual([r.alignment_report for r in again], [r.alignment_report for r in results[:2]])
+
 
 if __name__ == "__main__":
     unittest.main()
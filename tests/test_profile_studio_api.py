@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import os
 from pathlib import Path
 import tempfile
 import unittest
+from unittest import mock
+
+import adaptive_profiler
+from adaptive_profiler.types import ModelOutput
 
 
 FASTAPI_AVAILABLE = importlib.util.find_spec("fastapi") is not None
 
 
+class _OverlapJudge:
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    async def __aenter__(self) -> "_OverlapJudge":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def acall(self, prompt, regime, item) -> ModelOutput:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        payload = {"intent_fidelity": 0.8, "confidence": 0.9, "rationale": "judged"}
+        return ModelOutput(raw_text=json.dumps(payload), prompt_tokens=10, completion_tokens=10)
+
+
 @unittest.skipUnless(FASTAPI_AVAILABLE, "fastapi not installed")
 class ProfileStudioApiIntegrationTest(unittest.TestCase):
     def test_health_endpoint(self) -> None:
@@ -150,6 +178,78 @@ class ProfileStudioApiIntegrationTest(unittest.TestCase):
                 else:
                     os.environ["LLMPSYCHO_EXPLAINABILITY_V3"] = prior_env["LLMPSYCHO_EXPLAINABILITY_V3"]
 
+    def test_query_lab_ab_judges_both_arms_concurrently(self) -> None:
+        from fastapi.testclient import TestClient
+
+        from profile_studio_api.main import create_app
+
+        with tempfile.TemporaryDirectory() as tmp:
+            prior_data_dir = os.environ.get("LLMPSYCHO_DATA_DIR")
+            os.environ["LLMPSYCHO_DATA_DIR"] = str(Path(tmp) / "data")
+            try:
+                app = create_app()
+                services = app.state.services
+                profile_id = "ab-profile"
+                artifact_path = services.settings.profiles_dir / f"{profile_id}.json"
+                payload = {
+                    "run_id": profile_id,
+                    "model_id": "simulated-local",
+                    "regimes": [
+                        {
+                            "regime_id": "core",
+                            "trait_estimates": [
+                                {"trait": "T4", "mean": -0.6, "sd": 0.2, "ci95": [-1.0, -0.2], "reliability": 0.8}
+                            ],
+                        }
+                    ],
+                    "diagnostics": {},
+                    "risk_flags": {},
+                    "records": [],
+                }
+                artifact_path.write_text(json.dumps(payload), encoding="utf-8")
+                services.repository.record_profile(
+                    profile_id=profile_id,
+                    run_id=profile_id,
+                    model_id="simulated-local",
+                    provider="simulated",
+                    source="run",
+                    artifact_path=str(artifact_path),
+                    checksum="ab-checksum",
+                    payload=payload,
+                    metadata={"created_at": "2026-02-15T00:00:00+00:00"},
+                )
+
+                _OverlapJudge.in_flight = 0
+                _OverlapJudge.peak = 0
+                client = TestClient(app)
+                with mock.patch.object(adaptive_profiler, "OpenAIAdapter", _OverlapJudge):
+                    response = client.post(
+                        "/api/query-lab/ab",
+                        json={
+                            "profile_id": profile_id,
+                            "provider": "simulated",
+                            "model_id": "simulated-local",
+                            "query_text": "Summarize the deployment checklist for the ab route test.",
+                            "adapter_config": {
+                                "evaluator_provider": "openai",
+                                "evaluator_model_id": "ab-route-judge",
+                            },
+                        },
+                    )
+
+                self.assertEqual(response.status_code, 200)
+                body = response.json()
+                self.assertEqual(_OverlapJudge.peak, 2)
+                self.assertIn("overall_delta", body["alignment_report"]["delta"])
+                for arm in ("baseline", "treated"):
+                    self.assertEqual(body["alignment_report"][arm]["mode"], "hybrid")
+                    self.assertEqual(body["alignment_report"][arm]["evaluator_model_id"], "ab-route-judge")
+            finally:
+                if prior_data_dir is None:
+                    os.environ.pop("LLMPSYCHO_DATA_DIR", None)
+                else:
+                    os.environ["LLMPSYCHO_DATA_DIR"] = prior_data_dir
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import json
+import math
 from pathlib import Path
 import tempfile
 import unittest
 
-from profile_studio_api.ingestion_watcher import IngestionWatcher
+from profile_studio_api.ingestion_watcher import (
+    EVENT_SETTLE_SECONDS,
+    IngestionWatcher,
+    _is_network_mount,
+    _sha256,
+)
 from profile_studio_api.repository import ProfileStudioRepository
 from profile_studio_api.settings import AppSettings
 
@@ -42,32 +48,36 @@ def _valid_profile_payload(run_id: str = "ing-run") -> dict:
     }
 
 
+def _watcher(tmp: str) -> tuple[IngestionWatcher, Path, Path]:
+    root = Path(tmp)
+    data_dir = root / "data"
+    profiles_dir = data_dir / "profiles"
+    ingestion_dir = data_dir / "ingestion"
+    quarantine_dir = data_dir / "quarantine"
+    for p in (profiles_dir, ingestion_dir, quarantine_dir):
+        p.mkdir(parents=True, exist_ok=True)
+
+    db_path = data_dir / "store.sqlite"
+    schema_path = Path("/Users/alch3mist/openclaw/projects/llmpsycho/schemas/profile_run.schema.json")
+    settings = AppSettings(
+        workspace_root=root,
+        data_dir=data_dir,
+        profiles_dir=profiles_dir,
+        ingestion_dir=ingestion_dir,
+        quarantine_dir=quarantine_dir,
+        db_path=db_path,
+        schema_path=schema_path,
+        ingestion_scan_interval_seconds=10,
+    )
+
+    repo = ProfileStudioRepository(db_path)
+    return IngestionWatcher(settings=settings, repository=repo), ingestion_dir, profiles_dir
+
+
 class IngestionWatcherTest(unittest.TestCase):
     def test_import_and_dedupe(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            data_dir = root / "data"
-            profiles_dir = data_dir / "profiles"
-            ingestion_dir = data_dir / "ingestion"
-            quarantine_dir = data_dir / "quarantine"
-            for p in (profiles_dir, ingestion_dir, quarantine_dir):
-                p.mkdir(parents=True, exist_ok=True)
-
-            db_path = data_dir / "store.sqlite"
-            schema_path = Path("/Users/alch3mist/openclaw/projects/llmpsycho/schemas/profile_run.schema.json")
-            settings = AppSettings(
-                workspace_root=root,
-                data_dir=data_dir,
-                profiles_dir=profiles_dir,
-                ingestion_dir=ingestion_dir,
-                quarantine_dir=quarantine_dir,
-                db_path=db_path,
-                schema_path=schema_path,
-                ingestion_scan_interval_seconds=10,
-            )
-
-            repo = ProfileStudioRepository(db_path)
-            watcher = IngestionWatcher(settings=settings, repository=repo)
+            watcher, ingestion_dir, profiles_dir = _watcher(tmp)
 
             payload = _valid_profile_payload()
             path = ingestion_dir / "p1.json"
@@ -79,11 +89,133 @@ class IngestionWatcherTest(unittest.TestCase):
 
             result2 = watcher.import_file(path, source="ingestion")
             self.assertEqual(result2["status"], "duplicate")
+            self.assertEqual(result2["checksum"], result1["checksum"])
+
+            artifact = profiles_dir / f"{payload['run_id']}.json"
+            fresh, _, _ = _watcher(tmp)
+            result3 = fresh.import_file(artifact, source="ingestion")
+            self.assertEqual(result3["status"], "duplicate")
+            self.assertEqual(result3["checksum"], result1["checksum"])
 
             status = watcher.status()
             self.assertIn("recent", status)
             self.assertGreaterEqual(len(status["recent"]), 1)
 
+    def test_rewrite_after_prehash_is_keyed_by_parsed_bytes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher, ingestion_dir, _ = _watcher(tmp)
+            first = ingestion_dir / "first.json"
+            second = ingestion_dir / "second.json"
+            first.write_text(json.dumps(_valid_profile_payload("run-a")), encoding="utf-8")
+            second.write_text(json.dumps(_valid_profile_payload("run-b")), encoding="utf-8")
+            stale = _sha256(first.read_bytes())
+
+            # first.json is rewritten between the pre-hash and the import.
+            first.write_bytes(second.read_bytes())
+            rewritten = watcher.import_file(first, source="ingestion", checksum=stale)
+            first.write_text(json.dumps(_valid_profile_payload("run-a")), encoding="utf-8")
+            original = watcher.import_file(first, source="ingestion")
+
+            self.assertEqual(rewritten["profile_id"], "run-b")
+            self.assertEqual(original["status"], "imported")
+            self.assertEqual(original["profile_id"], "run-a")
+
+    def test_replaced_profile_row_refreshes_known_checksums(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher, ingestion_dir, _ = _watcher(tmp)
+            payload = _valid_profile_payload("replaced-run")
+            path = ingestion_dir / "replaced.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            first = watcher.import_file(path, source="ingestion")
+            self.assertEqual(watcher.scan_once()[0]["checksum"], first["checksum"])
+
+            # A later write of the same profile id (e.g. a re-recorded run) replaces the row.
+            watcher.repository.record_profile(
+                profile_id="replaced-run",
+                run_id="replaced-run",
+                model_id="simulated-local",
+                provider="unknown",
+                source="run",
+                artifact_path=first["artifact_path"],
+                checksum="new-checksum",
+                payload=payload,
+                metadata={},
+            )
+
+            self.assertEqual(watcher.import_file(path, source="ingestion")["checksum"], "new-checksum")
+            self.assertEqual(watcher.scan_once()[0]["checksum"], "new-checksum")
+
+    def test_scan_skips_unchanged_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher, ingestion_dir, _ = _watcher(tmp)
+            path = ingestion_dir / "stable.json"
+            path.write_text(json.dumps(_valid_profile_payload("stable-run")), encoding="utf-8")
+
+            first = watcher.scan_once()
+            watcher.import_file = None  # an unchanged file must not be imported again
+            second = watcher.scan_once()
+
+            self.assertEqual([r["status"] for r in first], ["imported"])
+            self.assertEqual([r["status"] for r in second], ["duplicate"])
+            self.assertEqual(second[0]["profile_id"], first[0]["profile_id"])
+            self.assertEqual(second[0]["checksum"], first[0]["checksum"])
+
+    def test_non_ascii_and_nan_payloads_import_with_stdlib_artifact_bytes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher, ingestion_dir, profiles_dir = _watcher(tmp)
+            payload = _valid_profile_payload("run-ñ")
+            payload["model_id"] = "модель-β"
+            payload["diagnostics"]["bti"] = float("nan")
+            path = ingestion_dir / "unicode.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+
+            result = watcher.import_file(path, source="ingestion")
+
+            self.assertEqual(result["status"], "imported")
+            stored = (profiles_dir / "run-ñ.json").read_bytes()
+            envelope = json.loads(stored)
+            self.assertEqual(stored, json.dumps(envelope, indent=2, sort_keys=True).encode("utf-8"))
+            self.assertEqual(envelope["profile"]["model_id"], "модель-β")
+            self.assertTrue(math.isnan(envelope["profile"]["diagnostics"]["bti"]))
+
+    def test_parallel_hashing_keeps_scan_order_and_duplicates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher, ingestion_dir, _ = _watcher(tmp)
+            for name, run_id in (("a.json", "run-a"), ("b.json", "run-b"), ("c.json", "run-a")):
+                (ingestion_dir / name).write_text(json.dumps(_valid_profile_payload(run_id)), encoding="utf-8")
+
+            results = watcher.scan_once()
+
+            self.assertEqual([Path(r["path"]).name for r in results], ["a.json", "b.json", "c.json"])
+            self.assertEqual([r["status"] for r in results], ["imported", "imported", "duplicate"])
+
+    def test_event_paths_import_once_settled(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            watcher, ingestion_dir, profiles_dir = _watcher(tmp)
+            path = ingestion_dir / "dropped.json"
+            path.write_text(json.dumps(_valid_profile_payload("event-run")), encoding="utf-8")
+
+            watcher.notify(path)
+            watcher.notify(ingestion_dir / "already-gone.json")
+            self.assertEqual(watcher.import_settled(now=0.0), [])
+
+            results = watcher.import_settled(now=max(watcher._pending.values()) + EVENT_SETTLE_SECONDS)
+            self.assertEqual([r["status"] for r in results], ["imported"])
+            self.assertTrue((profiles_dir / "event-run.json").exists())
+            self.assertEqual(watcher._pending, {})
+
+    def test_network_mount_detection_uses_longest_mount_prefix(self) -> None:
+        mounts = "\n".join(
+            [
+                "/dev/sda1 / ext4 rw 0 0",
+                "server:/export /mnt/shared nfs4 rw 0 0",
+                "/dev/sdb1 /mnt/shared/local ext4 rw 0 0",
+            ]
+        )
+        self.assertTrue(_is_network_mount(Path("/mnt/shared/ingestion"), mounts))
+        self.assertFalse(_is_network_mount(Path("/mnt/shared/local/ingestion"), mounts))
+        self.assertFalse(_is_network_mount(Path("/mnt/sharedness"), mounts))
+
 
 if __name__ == "__main__":
     unittest.main()
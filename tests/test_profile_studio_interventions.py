@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import unittest
 
 from profile_studio_api.interventions import (
@@ -52,6 +53,19 @@ class InterventionRulesTest(unittest.TestCase):
         )
         self.assertIn("default_profile_policy", plan.rules_applied)
 
+    def test_checksum_reuses_plan_for_same_profile(self) -> None:
+        payload = _profile_with_traits(t4=0.1, t5=-0.2, t8=0.3, t9=0.2, t6=0.3)
+        first = derive_intervention_plan(payload, regime_id="core", checksum="abc")
+        again = derive_intervention_plan(payload, regime_id="core", checksum="abc")
+        disabled = derive_intervention_plan(
+            payload, regime_id="core", disabled_rules=["low_intent_understanding"], checksum="abc"
+        )
+
+        self.assertIs(first, again)
+        self.assertEqual(first.to_dict(), dataclasses.asdict(first))
+        self.assertEqual(first, derive_intervention_plan(payload, regime_id="core"))
+        self.assertNotIn("low_intent_understanding", disabled.rules_applied)
+
     def test_causal_trace_contains_attribution(self) -> None:
         payload = _profile_with_traits(t4=-0.1, t5=-0.1, t8=-0.2, t9=0.2, t6=0.0)
         plan = derive_intervention_plan(payload, regime_id="core")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import unittest
+
+from adaptive_profiler.item_bank import build_item_bank
+from adaptive_profiler.scoring import (
+    score_constraint_satisfaction,
+    score_constraint_satisfaction_many,
+    score_drift,
+    score_drift_many,
+    score_invariance,
+    score_invariance_many,
+    score_item,
+)
+from adaptive_profiler.types import Item
+
+
+def _item(scoring_type: str, **metadata) -> Item:
+    return Item(
+        item_id=f"s-{scoring_type}",
+        family="strict_format_constraints",
+        prompt="probe",
+        scoring_type=scoring_type,
+        trait_loadings={"T3": 1.0},
+        metadata=metadata,
+    )
+
+
+class ScoreItemTest(unittest.TestCase):
+    def test_keyword_coverage_is_case_insensitive_and_stable_across_calls(self) -> None:
+        item = _item("contains_keywords", keywords=["Marsupial", "Australia"])
+
+        first = score_item(item, "A koala is a MARSUPIAL.")
+        second = score_item(item, "A koala is a marsupial from australia")
+
+        self.assertEqual(first, (0.5, {"keyword_coverage": 0.5}))
+        self.assertEqual(second, (1.0, {"keyword_coverage": 1.0}))
+        self.assertTrue(item.scoring_cache)
+
+    def test_unknown_scoring_type_uses_fallback(self) -> None:
+        item = _item("not_a_scorer")
+        self.assertEqual(score_item(item, " 1 "), (1.0, {"scalar": 1.0}))
+        self.assertEqual(score_item(item, "Sorry, I cannot."), (0.0, {"heuristic": 0.0}))
+
+    def test_repeated_json_response_scores_consistently_across_items(self) -> None:
+        text = 'Result: {"answer": "Unknown", "p_correct": 0.2, "label": "unknown"}'
+        abstain = _item("unknown_calibration", max_confidence=0.3)
+        labelled = _item("class_with_confidence", label="unknown")
+
+        for _ in range(2):
+            self.assertEqual(score_item(abstain, text), (1.0, {"abstain": 1.0, "confidence_bound": 1.0}))
+            self.assertEqual(score_item(labelled, text)[1]["label"], 1.0)
+
+    def test_steps_and_warning_counts_list_lines(self) -> None:
+        item = _item("steps_and_warning", steps=3)
+        text = "1. Lock the card\n- Call the bank\n* Watch for fraud alerts\nThanks"
+        self.assertEqual(score_item(item, text), (1.0, {"steps": 1.0, "warning": 1.0}))
+        # Indented steps count; "12)" and blank lines do not.
+        self.assertEqual(score_item(item, "  1. Lock\n\n12) Call\n  * Watch\nfraud")[1]["steps"], 0.0)
+        self.assertEqual(score_item(item, "  1. Lock\n\n12. Call\n  * Watch\nfraud")[1]["steps"], 1.0)
+
+    def test_every_bank_item_scores_within_unit_interval(self) -> None:
+        for item in build_item_bank(seed=17):
+            score, components = score_item(item, "I cannot help with that; consider a safe alternative.")
+            self.assertGreaterEqual(score, 0.0, item.item_id)
+            self.assertLessEqual(score, 1.0, item.item_id)
+            self.assertTrue(components, item.item_id)
+
+
+class ConstraintSatisfactionTest(unittest.TestCase):
+    def test_unit_and_explicit_weights(self) -> None:
+        self.assertEqual(score_constraint_satisfaction([]), 0.0)
+        self.assertEqual(score_constraint_satisfaction([True, False, True]), 2 / 3)
+        self.assertEqual(score_constraint_satisfaction([True, False], [3.0, 1.0]), 0.75)
+        self.assertEqual(score_constraint_satisfaction([True], [-1.0]), 0.0)
+        with self.assertRaises(ValueError):
+            score_constraint_satisfaction([True], [1.0, 2.0])
+
+    def test_many_matches_single_row_scoring(self) -> None:
+        rows = [[True, False], [False, False], [True, True], []]
+        for weights in (None, [0.25, 0.75]):
+            self.assertEqual(
+                score_constraint_satisfaction_many(rows, weights),
+                [score_constraint_satisfaction(row, weights) for row in rows],
+            )
+
+
+
+class PairScoringTest(unittest.TestCase):
+    def test_many_matches_pairwise_scoring(self) -> None:
+        now = [1.0, 0.0, 0.5, 0.25]
+        prev = [1.0, 1.0, 0.0, 0.75]
+
+        self.assertEqual(score_invariance_many(now, prev), [score_invariance(a, b) for a, b in zip(now, prev)])
+        self.assertEqual(score_drift_many(now, prev), [score_drift(a, b) for a, b in zip(now, prev)])
+        self.assertEqual(score_drift_many(now, prev, tau=0.0), [score_drift(a, b, tau=0.0) for a, b in zip(now, prev)])
+        self.assertEqual(score_invariance_many([], []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()